@@ -1,9 +1,13 @@
 import os
 import json
+import importlib.util
 import logging
+import threading
 import time
 from typing import Optional, Dict, Any, Type
 from pydantic import BaseModel
+import openai
+import anthropic
 from openai import OpenAI
 from anthropic import Anthropic
 
@@ -22,14 +26,21 @@ class UnifiedLLMClient:
         self.log_dir = log_dir
         self.suppress_console = False  # Set True in human mode to hide debug prints
         
+        # Keep-alive connection pools shared by the SDK clients; see _http_pool()
+        self._http_pools: Dict[str, Any] = {}
+
         # Initialize clients ONLY if keys are present (avoids error if using CLI only)
         self.openai_client = None
         if os.getenv("OPENAI_API_KEY"):
-            self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http_pool(openai))
             
         self.anthropic_client = None
         if os.getenv("ANTHROPIC_API_KEY"):
-            self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+            self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=self._http_pool(anthropic))
+
+        # Google client is created on first use (optional dependency)
+        self._google_client = None
+        self._google_lock = threading.Lock()
         
         # Ensure log dir exists
         if self.debug and self.log_dir:
@@ -41,6 +52,7 @@ class UnifiedLLMClient:
             self.xai_client = OpenAI(
                 api_key=os.getenv("XAI_API_KEY"),
                 base_url="https://api.x.ai/v1",
+                http_client=self._http_pool(openai),
             )
         
         # Groq (Llama)
@@ -49,6 +61,7 @@ class UnifiedLLMClient:
             self.groq_client = OpenAI(
                 api_key=os.getenv("GROQ_API_KEY"),
                 base_url="https://api.groq.com/openai/v1",
+                http_client=self._http_pool(openai),
             )
 
         # OpenRouter
@@ -57,7 +70,40 @@ class UnifiedLLMClient:
             self.openrouter_client = OpenAI(
                 api_key=os.getenv("OPENROUTER_API_KEY"),
                 base_url="https://openrouter.ai/api/v1",
+                http_client=self._http_pool(openai),
+            )
+
+    def _get_google_client(self):
+        """Shared google-genai client, created once"""
+        with self._google_lock:
+            if self._google_client is None:
+                from google import genai
+                self._google_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+            return self._google_client
+
+    def _http_pool(self, sdk):
+        """
+        Keep-alive pool for an SDK client, so turns reuse warm TLS connections across the
+        whole game instead of re-handshaking. SDKs built on the same HTTP package share one pool.
+        HTTP/2 (if the optional h2 package is installed) multiplexes concurrent turns
+        to the same host over one connection.
+        """
+        # Newer openai/anthropic releases are built on httpx2 and reject httpx objects
+        base = importlib.import_module(f"{sdk.__name__}._base_client")
+        http = getattr(base, "httpx2", None) or base.httpx
+        pool = self._http_pools.get(http.__name__)
+        if pool is None:
+            pool = self._http_pools[http.__name__] = http.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=http.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60),
+                timeout=http.Timeout(600.0, connect=10.0),
             )
+        return pool
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        for pool in self._http_pools.values():
+            pool.close()
 
     def _log_debug(self, player_name: str, turn_number: int, phase: str, prompt: str, response: str):
         if not self.log_dir:
@@ -110,6 +156,48 @@ class UnifiedLLMClient:
         with open(filename, "a", encoding="utf-8") as f:
             f.write(f"\n--- {phase} {turn_number} ---\nPROMPT:\n{prompt}\n\nRESPONSE:\n{log_response}\n\n" + "-"*80 + "\n")
 
+    def _read_json_stream(self, deltas) -> str:
+        """
+        Accumulate streamed text deltas and stop as soon as the first top-level
+        JSON object closes, so trailing tokens (chatter after the JSON) are never waited for.
+        Falls back to the full text if no complete object is seen.
+        """
+        parts = []
+        depth = 0
+        in_string = False
+        escaped = False
+        for delta in deltas:
+            if not delta:
+                continue
+            parts.append(delta)
+            for ch in delta:
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = depth > 0
+                elif ch == "{":
+                    depth += 1
+                elif ch == "}" and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(parts)
+        return "".join(parts)
+
+    def _stream_chat(self, client: OpenAI, **kwargs) -> str:
+        """OpenAI-compatible chat completion, streamed and cut at the end of the JSON object"""
+        stream = client.chat.completions.create(stream=True, **kwargs)
+        try:
+            return self._read_json_stream(
+                chunk.choices[0].delta.content for chunk in stream if chunk.choices
+            )
+        finally:
+            stream.close()  # Drop the connection instead of draining the remaining tokens
+
     def _repair_json(self, text: str) -> str:
         """Attempt to fix common LLM JSON errors."""
         import re
@@ -248,7 +336,9 @@ class UnifiedLLMClient:
                 print(f"CLI Error ({command}): {e.stderr}")
             raise e
 
-    def generate_turn(self, player_name: str, provider: str, model_name: str, system_prompt: str, turn_prompt: str, turn_number: int, phase: str = "Day", use_cli: bool = True) -> TurnOutput:
+    def generate_turn(self, player_name: str, provider: str, model_name: str, system_prompt: str, turn_prompt: str, turn_number: int, phase: str = "Day", use_cli: bool = True, system_static_len: int = 0) -> TurnOutput:
+        # system_static_len: length of the system_prompt prefix that is identical on every turn
+        # of this player (marked as a prompt-cache breakpoint where the provider supports it)
 
         full_prompt = f"{system_prompt}\n\n{turn_prompt}"
         # print(f"🔄 [{player_name}] Sending prompt to {provider}/{model_name}...")
@@ -281,7 +371,8 @@ class UnifiedLLMClient:
                 else:
                     # --- API MODE ---
                     if provider == "openai":
-                        response = self.openai_client.chat.completions.create(
+                        response_text = self._stream_chat(
+                            self.openai_client,
                             model=model_name,
                             messages=[
                                 {"role": "system", "content": system_prompt},
@@ -289,7 +380,6 @@ class UnifiedLLMClient:
                             ],
                             response_format={"type": "json_object"}
                         )
-                        response_text = response.choices[0].message.content
 
                     elif provider == "xai": # Grok
                         model = model_name
@@ -313,7 +403,8 @@ class UnifiedLLMClient:
                         response_text = response.choices[0].message.content
 
                     elif provider == "groq":
-                        response = self.groq_client.chat.completions.create(
+                        response_text = self._stream_chat(
+                            self.groq_client,
                             model=model_name,
                             messages=[
                                 {"role": "system", "content": system_prompt},
@@ -321,34 +412,37 @@ class UnifiedLLMClient:
                             ],
                             response_format={"type": "json_object"}
                         )
-                        response_text = response.choices[0].message.content
 
                     elif provider == "openrouter":
-                        response = self.openrouter_client.chat.completions.create(
+                        response_text = self._stream_chat(
+                            self.openrouter_client,
                             model=model_name,
                             messages=[
                                 {"role": "system", "content": system_prompt},
                                 {"role": "user", "content": turn_prompt},
                             ],
                         )
-                        response_text = response.choices[0].message.content
 
                     elif provider == "anthropic":
-                        response = self.anthropic_client.messages.create(
+                        system = system_prompt
+                        if system_static_len:
+                            system = [
+                                {"type": "text", "text": system_prompt[:system_static_len], "cache_control": {"type": "ephemeral"}},
+                                {"type": "text", "text": system_prompt[system_static_len:]},
+                            ]
+                        with self.anthropic_client.messages.stream(
                             model=model_name,
                             max_tokens=1024,
-                            system=system_prompt,
+                            system=system,
                             messages=[
                                 {"role": "user", "content": turn_prompt}
                             ]
-                        )
-                        response_text = response.content[0].text
+                        ) as stream:
+                            response_text = self._read_json_stream(stream.text_stream)
 
                     elif provider == "google":
-                        from google import genai
                         from google.genai import types
-                        client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-                        response = client.models.generate_content(
+                        response = self._get_google_client().models.generate_content(
                             model=model_name,
                             contents=turn_prompt,
                             config=types.GenerateContentConfig(
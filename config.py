@@ -6,6 +6,9 @@ TTS_RATE = "+30%"    # Speech speed: "+30%" = 30% faster, "-10%" = 10% slower
 AUTO_CONTINUE = True # Set to True to run without user intervention
 MEMORY_ENABLED = True # Set to True to enable distinct memories per player from previous games
 REVEAL_ROLE_ON_DEATH = False # Set to False to hide role when player dies
+MAX_CONCURRENT_TURNS = 4 # Max CLI-tool turns generated at once during voting (API turns are not capped)
+PROMPT_LOG_WINDOW = 0 # Public log entries kept verbatim in turn prompts; older ones are folded into a digest (0 = off, always send the full log)
+DIGEST_MODEL = {"provider": "google", "model": "gemini-2.5-flash", "use_cli": True} # Model that writes the log digest (needs its CLI/API set up)
 
 # Narrator voice for system announcements
 NARRATOR_VOICE = "en-US-AriaNeural"
@@ -3,21 +3,64 @@ import json
 import os
 import re
 import shutil
+import sys
 import time
+import queue
+import threading
 import concurrent.futures
+import contextlib
+from collections import Counter, defaultdict
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
-from models import Player, HumanPlayer
+from models import Player, HumanPlayer, load_memories
 from api_clients import UnifiedLLMClient
 from schemas import GameState, LogEntry, TurnOutput
 from config import (
-    TTS_ENABLED, AUTO_CONTINUE, MEMORY_ENABLED, REVEAL_ROLE_ON_DEATH,
+    TTS_ENABLED, AUTO_CONTINUE, MEMORY_ENABLED, REVEAL_ROLE_ON_DEATH, MAX_CONCURRENT_TURNS,
+    PROMPT_LOG_WINDOW, DIGEST_MODEL,
     NARRATOR_VOICE, ROLE_EMOJIS, PHASE_EMOJIS, ROSTER_CONFIG
 )
 from tts_engine import TTSEngine
 from input_listener import InputListener
 
+# Log display icon rules (see GameEngine.log)
+# Speaking events get specific icons
+ACTION_ICONS = {
+    ("Day", "speak"): "🗣️ ",
+    ("Night", "whisper"): "🌚 ",
+}
+# Short/Intense phases always use their phase icon for visibility
+FORCE_PHASE_ICON = {"Trial", "Setup", "Reflection"}
+
+# Action prefixes LLMs sometimes echo in front of a night target ("Kill Bob")
+KILL_PREFIX_RE = re.compile(r"^kill\s+", re.IGNORECASE)
+INVESTIGATE_PREFIX_RE = re.compile(r"^investigate\s+", re.IGNORECASE)
+
+# Trial vote round: hedge laggards once this share of AI voters has answered and a laggard
+# has run VOTE_HEDGE_AFTER x the median answer time; give up (default vote) after VOTE_DEADLINE s
+VOTE_HEDGE_QUORUM = 0.8
+VOTE_HEDGE_AFTER = 2.0
+VOTE_DEADLINE = 300.0
+
+# Console banners and templates (str.format with name=...)
+DEFENSE_HDR = "\n⚖️  {name} speaks for defense ⚖️"
+VOTING_HDR = "\n🗳️  VOTING TIME 🗳️"
+RESULTS_HDR = "\n📊 VOTING RESULTS 📊"
+COP_CHECK_TMPL = "\n🔍 {name} checks {target}... Result: {result}"
+TRAGEDY_TMPL = "\n🩸 TRAGEDY! {name} was found DEAD in the morning.🩸"
+
+# Narrator prompt for folding old public log entries (see _start_log_digest)
+DIGEST_SYS = """You keep the record of a Mafia game for the players.
+Merge the PREVIOUS SUMMARY with the NEW LOG ENTRIES into one updated summary (MAX 200 WORDS).
+Keep who accused, nominated and voted for whom, who died and how, revealed roles and claims.
+Stay neutral: report what was said, never guess hidden roles.
+
+OUTPUT: JSON only, no backticks.
+{"strategy": "YOUR_SUMMARY_HERE", "speech": "LOG_DIGEST", "vote": null}
+"""
+DIGEST_TIMEOUT = 60.0  # Seconds Day start waits for a pending digest before going on with the full log
+
 
 class GameEngine:
     def __init__(self, tts_enabled: bool = TTS_ENABLED):
@@ -37,12 +80,26 @@ class GameEngine:
 
         with open(self.game_log_path, "w", encoding='utf-8') as f:
             f.write(f"=== MAFIA GAME LOG ({timestamp}) ===\n")
+        self._log_buffer: List[str] = []  # Pending game log lines, handed to the writer by _log_flush()
+
+        # Dedicated writer thread owns the game log file; None shuts it down
+        self._log_q: queue.Queue = queue.Queue()
+        self._log_writer = threading.Thread(target=self._log_writer_loop, daemon=True)
+        self._log_writer.start()
 
         # Restore individual player logs in logs/ dir
         self.client = UnifiedLLMClient(debug=True, log_dir="logs")
         self.state = GameState(reveal_role_on_death=REVEAL_ROLE_ON_DEATH)
-        self.players: List[Player] = []
-        self.active_players: Dict[str, Player] = {}  # Name -> Player obj
+        self.active_players: Dict[str, Player] = {}  # Name -> Player obj (canonical)
+        self._player_order: List[str] = []  # Seating order (names)
+
+        # Role -> emoji table, resolved once (see _get_role_emoji)
+        self._role_emoji: Dict[str, str] = dict(ROLE_EMOJIS)
+
+        # Long-lived worker pool for background turns and reflection
+        self._bg_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="mafia-bg")
+        # Caps concurrent CLI-tool voter turns on the pool
+        self._turn_slots = threading.BoundedSemaphore(MAX_CONCURRENT_TURNS)
 
         # Initialize TTS
         self.tts = TTSEngine(enabled=tts_enabled)
@@ -52,18 +109,56 @@ class GameEngine:
         self.human_player: Optional[Player] = None
         self.human_role: Optional[str] = None
         self.listener: Optional[InputListener] = None  # Set in run()
+        self._announce_batch: List[str] = []  # See _announce_later()
+
+        # Monotonic phase clock - log entries carry time relative to it
+        self._phase_start = time.monotonic()
+
+        # Living role counters, kept in sync by _kill()
+        self._alive_mafia = 0
+        self._alive_town = 0
+        self._living_cache: Optional[List[Player]] = None  # Rebuilt lazily after a death
+        self._digest_future: Optional[concurrent.futures.Future] = None  # See _start_log_digest()
+        self._digest_disabled = False  # Set after the first failed digest; the rest of the game keeps the full log
+
+    @property
+    def players(self) -> List[Player]:
+        """Players in seating order, derived from active_players."""
+        return [self.active_players[n] for n in self._player_order]
 
     def _log_to_file(self, text: str):
-        """Write to game log file only"""
-        try:
-            with open(self.game_log_path, "a", encoding='utf-8') as f:
-                f.write(str(text) + "\n")
-        except:
-            pass
+        """Queue a line for the game log file only (written on _log_flush)"""
+        self._log_buffer.append(str(text))
+
+    def _log_flush(self):
+        """Hand buffered game log lines to the writer thread as one write"""
+        if not self._log_buffer:
+            return
+        lines, self._log_buffer = self._log_buffer, []
+        self._log_q.put("\n".join(lines) + "\n")
+
+    def _log_writer_loop(self):
+        """Writer thread: keeps the game log open and flushes only when the queue drains"""
+        with open(self.game_log_path, "a", encoding='utf-8') as log_file:
+            while True:
+                text = self._log_q.get()
+                try:
+                    if text is None:
+                        return
+                    log_file.write(text)
+                    if self._log_q.empty():
+                        log_file.flush()
+                except Exception as e:
+                    print(f"[Log Writer Error] {e}")
+                finally:
+                    self._log_q.task_done()
 
     def _print_console(self, text: str):
         """Print to console only"""
-        print(text)
+        # Resolve sys.stdout per call - main.py swaps it for the tee Logger
+        out = sys.stdout.write
+        out(text)
+        out("\n")
 
     def _is_human_alive(self) -> bool:
         """Check if human player is still alive (for spoiler filtering)"""
@@ -78,15 +173,28 @@ class GameEngine:
 
     def _announce(self, text: str, background: bool = False):
         """Speak system announcement with narrator voice"""
+        if not self.tts.enabled:
+            return
         self.tts.speak(text, voice=NARRATOR_VOICE, background=background)
 
+    def _announce_later(self, text: str):
+        """Queue an announcement to be spoken together with others on _announce_flush()"""
+        self._announce_batch.append(text.rstrip("."))
+
+    def _announce_flush(self, background: bool = False):
+        """Speak all queued announcements as one TTS synthesis"""
+        if not self._announce_batch:
+            return
+        text = ". ".join(self._announce_batch) + "."
+        self._announce_batch.clear()
+        self._announce(text, background=background)
+
     def log(self, phase: str, actor: str, action: str, content: str, is_secret: bool = False, vote_target: str = None, target_log: str = None):
         # Determine display name with number if actor is a player
         actor_display = actor
-        player = next((p for p in self.players if p.state.name == actor), None)
+        player = self.active_players.get(actor)
         if player:
-            idx = self.players.index(player) + 1
-            actor_display = f"{idx}. {actor}:"
+            actor_display = f"{player.player_index}. {actor}:"
 
             # Add role icon for terminal display only
             # In human mode, only show icon for human's own role or partner (unless human is dead = spectator)
@@ -96,7 +204,7 @@ class GameEngine:
                             (self.human_player and player.state.name == self.human_player.state.name) or
                             (self.human_role == "Mafia" and self.human_player and player.state.name == self.human_player.partner_name))
                 if show_icon:
-                    actor_display = f"{self._get_role_emoji(player.state.role)} {actor_display}"
+                    actor_display = f"{self._role_emoji.get(player.state.role, '👤')} {actor_display}"
 
         # Append vote text to content for persistent history
         if vote_target:
@@ -104,12 +212,16 @@ class GameEngine:
              if "Voted for" not in content and "Suggests killing" not in content and "[Nominated" not in content and "[Suggests" not in content:
                   content = f"{content} {vote_marker}"
 
+        if action == "PhaseStart":
+            self._phase_start = time.monotonic()
+
         entry = LogEntry(
             turn=self.state.turn,
             phase=phase,
             actor=actor,
             action=action,
-            content=content
+            content=content,
+            t_rel=time.monotonic() - self._phase_start
         )
         
         # Add Phase Icon
@@ -122,49 +234,43 @@ class GameEngine:
              vote_str = f" [{icon} {vote_target}]"
 
         # Determine Display Icon Rules
-        # DEFAULT: No icon
-        display_icon = ""
-        
         # Rule 1: Phase Start ALWAYS gets the phase icon
         if action == "PhaseStart":
             display_icon = phase_icon
-        
         # Rule 2: Speaking events get specific icons
-        elif phase == "Day" and action == "speak":
-            display_icon = "🗣️ "
-        elif phase == "Night" and action == "whisper":
-            display_icon = "🌚 "
-        
+        elif (phase, action) in ACTION_ICONS:
+            display_icon = ACTION_ICONS[(phase, action)]
         # Rule 3: Short/Intense phases always use their icon for visibility
-        elif phase in ["Trial", "Setup", "Reflection"]:
-             display_icon = phase_icon
-             
+        elif phase in FORCE_PHASE_ICON:
+            display_icon = phase_icon
         # Rule 4: Day/Night System messages (Info, etc) -> NO ICON
         # This prevents the "sun/moon on every line" issue.
-        
+        else:
+            display_icon = ""
+
         if is_secret:
             # Route secret logs to correct private log based on actor/context
             effective_target = target_log  # Track for spoiler determination
 
             # Explicit override
             if target_log == "Cop":
-                 self.state.cop_logs.append(entry)
+                 self.state.add_cop_log(entry)
             elif target_log == "Mafia":
-                 self.state.mafia_logs.append(entry)
+                 self.state.add_mafia_log(entry)
 
             # Auto-detect Cop actions
             elif (player and player.state.role == "Cop") or action == "investigate":
-                 self.state.cop_logs.append(entry)
+                 self.state.add_cop_log(entry)
                  effective_target = "Cop"
 
             # Auto-detect Cop System logs
             elif str(content).startswith("Investigation Result") or str(content).startswith("Investigation failed"):
-                 self.state.cop_logs.append(entry)
+                 self.state.add_cop_log(entry)
                  effective_target = "Cop"
 
             # Default: Mafia (including System messages for Night phase calls)
             else:
-                 self.state.mafia_logs.append(entry)
+                 self.state.add_mafia_log(entry)
                  effective_target = "Mafia"
 
             # Determine if this is a spoiler for human
@@ -178,10 +284,15 @@ class GameEngine:
             display_content = content.replace("[Nominated", "[👉 Nominated").replace("[Suggests killing", "[🔪 Suggests killing").replace("[Defense]", "[🛡️ Defense]").replace("votes guilty", "👎 votes guilty").replace("votes innocent", "👍 votes innocent").replace("abstains", "⏸️ abstains")
             self._print(f"\n{display_icon}{actor_display} {vote_str} {display_content}", spoiler=is_spoiler)
         else:
-            self.state.public_logs.append(entry)
+            self.state.add_public_log(entry)
             display_content = content.replace("[Nominated", "[👉 Nominated").replace("[Suggests killing", "[🔪 Suggests killing").replace("[Defense]", "[🛡️ Defense]").replace("votes guilty", "👎 votes guilty").replace("votes innocent", "👍 votes innocent").replace("abstains", "⏸️ abstains")
             self._print(f"\n{display_icon}{actor_display}{vote_str} {display_content}")
 
+        # Console and game log writes are buffered; push them out on phase boundaries
+        if action == "PhaseStart":
+            sys.stdout.flush()
+            self._log_flush()
+
     def setup_game(self):
         self._print("Initializing Game...")
 
@@ -193,6 +304,11 @@ class GameEngine:
         if player_count < 3:
             raise ValueError(f"Need at least 3 active players, got {player_count}")
 
+        # Read this roster's memory files in the background while roles are assigned
+        memories_future = None
+        if MEMORY_ENABLED:
+            memories_future = self._bg_pool.submit(load_memories, names=[c["name"] for c in roster])
+
         # 2. Assign Roles (2 Mafia, 1 Cop, rest Villagers)
         # First respect role preferences from config, then fill randomly
         indices = list(range(player_count))
@@ -230,6 +346,7 @@ class GameEngine:
                 cop_index = random.choice(remaining)
 
         mafia_names = []
+        memories = memories_future.result() if memories_future else None
 
         # Create Players
         for i, config in enumerate(roster):
@@ -259,9 +376,10 @@ class GameEngine:
                     client=self.client,
                     player_index=i+1,
                     use_cli=config.get("use_cli", True),
-                    memory_enabled=MEMORY_ENABLED
+                    memory_enabled=MEMORY_ENABLED,
+                    memories=memories
                 )
-            self.players.append(p)
+            self._player_order.append(p.state.name)
             self.state.players.append(p.state)
             self.active_players[p.state.name] = p
 
@@ -271,16 +389,20 @@ class GameEngine:
             if role == "Mafia":
                 mafia_names.append(p.state.name)
 
+        self._alive_mafia = len(mafia_names)
+        self._alive_town = len(self._player_order) - self._alive_mafia
+        self._living_cache = None
+        self.state.set_roster()
+
         # Introduce Partners
-        for p in self.players:
-            if p.state.role == "Mafia":
-                partner = [n for n in mafia_names if n != p.state.name]
-                if partner:
-                    p.set_partner(partner[0])
+        if len(mafia_names) == 2:
+            a, b = mafia_names
+            self.active_players[a].set_partner(b)
+            self.active_players[b].set_partner(a)
 
         # Show human their role privately
         if self.human_mode and self.human_player:
-            role_emoji = self._get_role_emoji(self.human_role)
+            role_emoji = self._role_emoji.get(self.human_role, "👤")
             self._print_console(f"\n{'='*40}")
             self._print_console(f"You are {self.human_player.state.name}")
             self._print_console(f"Your role: {role_emoji} {self.human_role}")
@@ -297,41 +419,96 @@ class GameEngine:
              self.log("Setup", "System", "CopReveal", f"Cop: {cop_names[0]}", is_secret=True, target_log="Cop")
 
     def _get_living_players(self) -> List[Player]:
-        return [p for p in self.players if p.state.is_alive]
+        """Living players in seating order. Cached until the next _kill(); don't mutate."""
+        if self._living_cache is None:
+            self._living_cache = [self.active_players[n] for n in self._player_order if self.active_players[n].state.is_alive]
+        return self._living_cache
+
+    def _start_log_digest(self):
+        """
+        Fold all but the newest PROMPT_LOG_WINDOW/2 unsummarized public entries into the digest,
+        once more than PROMPT_LOG_WINDOW have piled up. Runs in the background; see _apply_log_digest().
+        """
+        if not PROMPT_LOG_WINDOW or self._digest_disabled or self._digest_future is not None:
+            return
+        logs = self.state.public_logs
+        digest, upto, offset = self.state.public_log_digest or ("", 0, 0)
+        fold_to = len(logs) - PROMPT_LOG_WINDOW // 2
+        if len(logs) - upto <= PROMPT_LOG_WINDOW or fold_to <= upto:
+            return
+        entries = logs[upto:fold_to]
+        offset += sum(len(log.formatted) for log in entries)
+        self._digest_future = self._bg_pool.submit(self._summarize_logs, digest, entries, fold_to, offset)
+
+    def _summarize_logs(self, digest: str, entries: List[LogEntry], upto: int, offset: int) -> Tuple[str, int, int]:
+        parts = ["--- PREVIOUS SUMMARY ---\n", digest or "None", "\n\n--- NEW LOG ENTRIES ---\n"]
+        parts.extend(log.formatted for log in entries)
+        output = self.client.generate_turn(
+            player_name="Digest",
+            provider=DIGEST_MODEL["provider"],
+            model_name=DIGEST_MODEL["model"],
+            system_prompt=DIGEST_SYS,
+            turn_prompt="".join(parts),
+            turn_number=self.state.turn,
+            phase="Digest",
+            use_cli=DIGEST_MODEL.get("use_cli", True)
+        )
+        if not output.strategy or not output.strategy.strip():
+            raise ValueError("empty digest")
+        return output.strategy.strip(), upto, offset
+
+    def _apply_log_digest(self):
+        """Swap in a finished digest (waits up to DIGEST_TIMEOUT).
+        On failure or timeout prompts keep the full log and the digest is off for the rest of the game."""
+        if self._digest_future is None:
+            return
+        future, self._digest_future = self._digest_future, None
+        try:
+            self.state.public_log_digest = future.result(timeout=DIGEST_TIMEOUT)
+        except Exception as e:
+            # concurrent.futures.TimeoutError has an empty message
+            reason = e if str(e) else f"no digest within {DIGEST_TIMEOUT:.0f}s"
+            self._print(f"Log digest failed, keeping full log for the rest of the game: {reason}")
+            self._digest_disabled = True
 
     def _pause_game(self, listener):
         """Handle pause state - wait for SPACE to resume"""
         self._print("\n[PAUSED] Press SPACE to resume...")
-        while True:
-            if listener.check_for_space():
-                self._print("[RESUMED]")
-                return
-            time.sleep(0.1)
+        # Sleep in poll() until a key arrives instead of spinning
+        while not listener.wait_for_space():
+            pass
+        self._print("[RESUMED]")
 
     def _wait_for_speech_with_pause(self, listener):
         """Wait for TTS to finish while checking for SPACE to pause"""
-        while self.tts._current_thread and self.tts._current_thread.is_alive():
+        if not self.tts.enabled:
+            return
+        while self.tts.is_speaking():
             if listener and listener.check_for_space():
                 self._pause_game(listener)
-            time.sleep(0.1)
+            # Wakes as soon as playback ends, unlike a fixed sleep
+            self.tts.wait_for_speech(timeout=0.1)
 
     def _wait_for_next(self, listener=None):
+        self._log_flush()
         if AUTO_CONTINUE:
-            # Poll for SPACE key during sleep
-            steps = 20  # 2 seconds / 0.1s
-            for _ in range(steps):
-                if listener and listener.check_for_space():
+            # Wait for SPACE key in poll() for up to 2 seconds
+            deadline = time.monotonic() + 2.0
+            while (remaining := deadline - time.monotonic()) > 0:
+                if listener is None:
+                    time.sleep(remaining)
+                    break
+                if listener.wait_for_space(remaining):
                     self._pause_game(listener)
                     return
-                time.sleep(0.1)
             return
         input("\n[PRESS ENTER TO CONTINUE NEXT ACTION] >> ")
 
     # --- HELPER METHODS ---
 
     def _get_role_emoji(self, role: str) -> str:
-        """Get emoji for role. Single source of truth."""
-        return ROLE_EMOJIS.get(role, "👤")
+        """Get emoji for role. Hot paths read self._role_emoji directly."""
+        return self._role_emoji.get(role, "👤")
 
     def _get_strategy_prefix(self, player: Player) -> str:
         """Get prefix for strategy display (includes role emoji for Mafia/Cop)."""
@@ -351,13 +528,11 @@ class GameEngine:
 
     def _take_player_turn(self, player: Player) -> TurnOutput:
         """Take a player's turn, handling terminal mode for human players."""
-        is_human = isinstance(player, HumanPlayer)
+        is_human = player.state.is_human
         if is_human:
-            # Wait for TTS to finish before showing human prompt
-            self.tts.wait_for_speech()
-            # Announce it's their turn
+            # Announce it's their turn - a foreground announcement plays after
+            # any queued speech and blocks until done, so the prompt follows the audio
             self._announce("Your turn")
-            self.tts.wait_for_speech()
             if self.listener:
                 self.listener.pause_for_input()
         try:
@@ -367,74 +542,128 @@ class GameEngine:
                 self.listener.resume_cbreak()
         return output
 
-    def _start_background_turn(self, player: Player) -> Tuple[Optional[concurrent.futures.Future], Optional[concurrent.futures.ThreadPoolExecutor]]:
-        """Start a player's turn in background thread. Returns (future, executor)."""
+    def _start_background_turn(self, player: Player, game_state: Optional[GameState] = None) -> Tuple[Optional[concurrent.futures.Future], Optional[concurrent.futures.ThreadPoolExecutor]]:
+        """Start a player's turn on the shared background pool. Returns (future, executor).
+        Executor is always None now; kept in the tuple for existing call sites.
+        Pass game_state to prompt from a snapshot instead of the live state."""
         if not player:
             return None, None
         # Don't background human players - they need interactive input
-        if isinstance(player, HumanPlayer):
+        if player.state.is_human:
             return None, None
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = executor.submit(player.take_turn, self.state, self.state.turn)
-        return future, executor
+        future = self._bg_pool.submit(player.take_turn, game_state or self.state, self.state.turn)
+        return future, None
 
-    def _get_background_result(self, future: Optional[concurrent.futures.Future], executor: Optional[concurrent.futures.ThreadPoolExecutor]) -> Optional[TurnOutput]:
-        """Get result from background turn and cleanup executor."""
+    def _get_background_result(self, future: Optional[concurrent.futures.Future], executor: Optional[concurrent.futures.ThreadPoolExecutor] = None) -> Optional[TurnOutput]:
+        """Get result from background turn. The shared pool outlives the call, so executor is ignored."""
         if not future:
             return None
-        result = future.result()
-        if executor:
-            executor.shutdown()
-        return result
-
-    def _check_game_ends_after_death(self, victim_name: str) -> bool:
-        """Check if game would end after this player's death."""
-        future_living = [p for p in self._get_living_players() if p.state.name != victim_name]
-        future_mafia = sum(1 for p in future_living if p.state.role == "Mafia")
-        future_town = sum(1 for p in future_living if p.state.role != "Mafia")
-        return (future_mafia == 0) or (future_mafia >= future_town)
+        return future.result()
 
-    def _collect_votes_concurrently(self, voters: List[Player], all_votes: dict, listener, nominees: List[str]):
-        """Collect votes from all voters in up to 4 concurrent processes"""
+    def _prepare_speech_ahead(self, turn_future: Optional[concurrent.futures.Future], speaker: str) -> Optional[concurrent.futures.Future]:
+        """Synthesize a background turn's speech on the pool so audio is ready before it's needed.
+        The returned future yields the audio path (or None)."""
+        if not turn_future or not self.tts.enabled:
+            return None
 
-        def collect_voter_vote(voter: Player):
-            """Collect one voter's single vote for a nominee (MANDATORY)"""
+        def synthesize():
             try:
-                # Set phase to Trial for voting context (they're voting on nominees)
-                output = voter.take_turn(self.state, self.state.turn)
+                output = turn_future.result()
+            except Exception:
+                return None  # Turn error is reported by whoever consumes turn_future
+            return self.tts.prepare_speech(output.speech or "", speaker, announce_name=True)
+
+        return self._bg_pool.submit(synthesize)
+
+    def close(self):
+        """Flush pending file writes and shut down background workers at game end."""
+        self._log_flush()
+        self._log_q.put(None)
+        self._log_writer.join()
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+    def _kill(self, victim: Player):
+        """Mark a player dead and keep the living role counters in sync."""
+        if not victim.state.is_alive:
+            return
+        victim.state.is_alive = False
+        self.state.mark_dead(victim.state.name, victim.state.role)
+        self._living_cache = None
+        if victim.state.role == "Mafia":
+            self._alive_mafia -= 1
+        else:
+            self._alive_town -= 1
 
-                if output.strategy:
-                    prefix = self._get_strategy_prefix(voter)
-                    strategy_line = f"\n💭 {prefix}{voter.state.name} Strategy: {output.strategy}"
-                    self._print(strategy_line, spoiler=self.human_mode)
+    def _check_game_ends_after_death(self, victim: Player) -> bool:
+        """Check if game would end after this (living) player's death."""
+        is_mafia = victim.state.role == "Mafia"
+        future_mafia = self._alive_mafia - (1 if is_mafia else 0)
+        future_town = self._alive_town - (0 if is_mafia else 1)
+        return (future_mafia == 0) or (future_mafia >= future_town)
 
-                # Get the player name they vote for - MANDATORY, no abstain
-                vote = (output.vote or "").lower().strip()
-                # Validate: must be a nominee, not just any living player
-                valid_targets = [n.lower() for n in nominees]
-                if vote and vote in valid_targets:
-                    # Return with proper capitalization
-                    target = next(n for n in nominees if n.lower() == vote)
-                    return voter.state.name, target
-                else:
-                    # Invalid vote - default to first nominee
-                    default_target = nominees[0]
-                    self._print(f"[WARN] {voter.state.name} invalid vote '{vote}'. Defaulting to {default_target}")
-                    return voter.state.name, default_target
-            except Exception as e:
-                self._print(f"Error voting for {voter.state.name}: {e}")
-                default_target = nominees[0]
-                return voter.state.name, default_target
+    def _collect_votes_concurrently(self, voters: List[Player], all_votes: dict, listener, nominees: List[str]):
+        """Collect votes from all voters concurrently (at most MAX_CONCURRENT_TURNS CLI turns at once).
+        Laggard AI voters get a hedged duplicate request; see VOTE_HEDGE_QUORUM."""
+        # Every AI voter prompts from the same pre-vote snapshot, so turns that start late
+        # (waiting on a slot) don't see votes already cast - the vote stays simultaneous
+        vote_state = self.state.snapshot()
+
+        def vote_turn(voter: Player) -> TurnOutput:
+            # Set phase to Trial for voting context (they're voting on nominees)
+            # Only local CLI tools need the cap; API turns go out together as one burst
+            # that the provider can batch server-side
+            slot = self._turn_slots if voter.state.use_cli else contextlib.nullcontext()
+            with slot:
+                # No state mutation here: a losing hedge copy or deadline laggard may finish
+                # after the round, so its strategy is applied by resolve_vote for the chosen output only
+                return voter.generate_turn(vote_state, vote_state.turn)
+
+        def resolve_vote(voter: Player, output) -> str:
+            """Turn one voter's output (or error) into a single vote for a nominee (MANDATORY)"""
+            if isinstance(output, Exception):
+                self._print(f"Error voting for {voter.state.name}: {output}")
+                return nominees[0]
+
+            if output.strategy:
+                voter.state.strategy = output.strategy
+                prefix = self._get_strategy_prefix(voter)
+                strategy_line = f"\n💭 {prefix}{voter.state.name} Strategy: {output.strategy}"
+                self._print(strategy_line, spoiler=self.human_mode)
+
+            # Get the player name they vote for - MANDATORY, no abstain
+            vote = (output.vote or "").lower().strip()
+            # Validate: must be a nominee, not just any living player
+            valid_targets = [n.lower() for n in nominees]
+            if vote and vote in valid_targets:
+                # Return with proper capitalization
+                return next(n for n in nominees if n.lower() == vote)
+            # Invalid vote - default to first nominee
+            default_target = nominees[0]
+            self._print(f"[WARN] {voter.state.name} invalid vote '{vote}'. Defaulting to {default_target}")
+            return default_target
 
         # Separate human player from AI voters
         human_voter = None
         ai_voters = []
         for voter in voters:
-            if isinstance(voter, HumanPlayer):
+            if voter.state.is_human:
                 human_voter = voter
             else:
                 ai_voters.append(voter)
 
+        # Start AI votes on the shared pool so they generate while the human answers
+        owner = {}  # future -> voter (primary and hedged requests)
+        submitted_at = {}  # future -> monotonic time it was submitted
+
+        def submit(voter: Player):
+            future = self._bg_pool.submit(vote_turn, voter)
+            owner[future] = voter
+            submitted_at[future] = time.monotonic()
+            return future
+
+        pending = {submit(voter) for voter in ai_voters}
+
         # Collect human vote first (needs terminal input)
         if human_voter:
             voter_name, vote = None, None
@@ -455,15 +684,58 @@ class GameEngine:
             all_votes[voter_name] = vote
             self.log("Trial", voter_name, "vote", f"votes for {vote}")
 
-        # Use ThreadPoolExecutor with max 4 workers for concurrent AI voting
-        if ai_voters:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [executor.submit(collect_voter_vote, voter) for voter in ai_voters]
-
-                for future in concurrent.futures.as_completed(futures):
-                    voter_name, vote = future.result()
-                    all_votes[voter_name] = vote
-                    self.log("Trial", voter_name, "vote", f"votes for {vote}")
+        # Gather AI outputs. Once VOTE_HEDGE_QUORUM of voters are in and a laggard has taken
+        # VOTE_HEDGE_AFTER x the median time, send that voter's prompt again and take whichever
+        # copy answers first - the round then ends near the quorum's latency, not the slowest model's.
+        outputs = {}  # voter name -> TurnOutput or Exception
+        answer_secs = []  # How long each successful first answer took (fast failures would skew the median)
+        hedged = set()
+        deadline = time.monotonic() + VOTE_DEADLINE  # Counted from here so a slow human doesn't eat it
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = concurrent.futures.wait(
+                pending, timeout=min(remaining, 1.0), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            for future in done:
+                voter = owner[future]
+                if voter.state.name in outputs:
+                    continue
+                try:
+                    outputs[voter.state.name] = future.result()
+                    answer_secs.append(now - submitted_at[future])
+                except Exception as e:
+                    # A failed copy only counts if the voter has no other copy still running
+                    if not any(owner[f] is voter for f in pending):
+                        outputs[voter.state.name] = e
+            # The other copy of a voter who has answered is no longer needed; cancel() keeps it
+            # from starting if it is still queued for a pool worker
+            for future in [f for f in pending if owner[f].state.name in outputs]:
+                future.cancel()
+                pending.discard(future)
+
+            if answer_secs and len(outputs) >= VOTE_HEDGE_QUORUM * len(ai_voters):
+                median = sorted(answer_secs)[len(answer_secs) // 2]
+                for future in list(pending):
+                    voter = owner[future]
+                    # Measured from this copy's own submission, not from the start of the round
+                    if voter.state.name not in hedged and now - submitted_at[future] > VOTE_HEDGE_AFTER * median:
+                        hedged.add(voter.state.name)
+                        pending.add(submit(voter))
+
+        for future in pending:
+            future.cancel()  # Deadline laggards and their hedges (no-op if already running)
+
+        # Record in seat order, not completion order, so the log and tie-breaks don't depend on model speed
+        for voter in ai_voters:
+            output = outputs.get(voter.state.name)
+            if output is None:
+                output = TimeoutError(f"no vote within {VOTE_DEADLINE:.0f}s")
+            vote = resolve_vote(voter, output)
+            all_votes[voter.state.name] = vote
+            self.log("Trial", voter.state.name, "vote", f"votes for {vote}")
 
     def _save_game_stats(self, winner: str):
         """Save game stats to game_stats.json"""
@@ -500,25 +772,27 @@ class GameEngine:
         stats["games"].append(game_record)
 
         with open(stats_path, "w", encoding="utf-8") as f:
-            json.dump(stats, f, indent=2)
+            json.dump(stats, f, separators=(",", ":"))
 
         self._print(f"[Stats] Game saved to {stats_path}")
 
     def check_game_over(self) -> bool:
-        mafia_count = sum(1 for p in self._get_living_players() if p.state.role == "Mafia")
-        town_count = sum(1 for p in self._get_living_players() if p.state.role != "Mafia")
+        mafia_count = self._alive_mafia
+        town_count = self._alive_town
 
         if mafia_count == 0:
             self._print("\n🎉 TOWN WINS! All Mafia eliminated. 🎉")
-            self._announce("Town wins! All Mafia have been eliminated")
+            self._announce_later("Town wins! All Mafia have been eliminated")
             self._save_game_stats("Town")
             self._run_reflection("Town")
+            self._announce_flush()
             return True
         if mafia_count >= town_count:
             self._print("\n💀 MAFIA WINS! They have parity with Town. 💀")
-            self._announce("Mafia wins!")
+            self._announce_later("Mafia wins!")
             self._save_game_stats("Mafia")
             self._run_reflection("Mafia")
+            self._announce_flush()
             return True
         return False
 
@@ -528,7 +802,7 @@ class GameEngine:
             self.setup_game()
     
             while True:
-                # Wait for any remaining TTS before checking win
+                # Gates: game-over / Day banner only after the morning death announcement is heard
                 self.tts.wait_for_speech()
     
                 # Check Win Condition
@@ -537,14 +811,17 @@ class GameEngine:
     
                 # --- DAY PHASE ---
                 self.state.phase = "Day"
+                # Digest was started at nightfall; prompts from here on use it
+                self._apply_log_digest()
     
                 self.log("Day", "System", "PhaseStart", f"Day {self.state.turn}")
                 self._announce(f"Day {self.state.turn} begins")
 
                 # Determine Speaking Order (Rotate based on Day)
                 # Day 1 start index 0, Day 2 start index 1, etc.
-                start_idx = (self.state.turn - 1) % len(self.players)
-                rotated_roster = self.players[start_idx:] + self.players[:start_idx]
+                players = self.players
+                start_idx = (self.state.turn - 1) % len(players)
+                rotated_roster = players[start_idx:] + players[:start_idx]
                 ordered_living = [p for p in rotated_roster if p.state.is_alive]
 
                 # 1. Speaking Round
@@ -585,7 +862,7 @@ class GameEngine:
                         
                         tts_text = f"{speech} {spoken_action}".strip() if speech else spoken_action
                         audio_path = None
-                        if tts_text:
+                        if tts_text and self.tts.enabled:
                             # This blocks MAIN thread but runs while PREV TTS thread is playing
                             audio_path = self.tts.prepare_speech(tts_text, player.state.name, announce_name=True)
 
@@ -611,17 +888,17 @@ class GameEngine:
     
                 # 2. Trial Round
                 # Identify Nominees (anyone with at least one nomination)
-                nominee_counts = {}
-                for target in nominations.values():
-                     # Case-insensitive match, use proper name capitalization
-                     matched = next((p.state.name for p in living if p.state.name.lower() == target.lower()), None)
-                     if matched:
-                         nominee_counts[matched] = nominee_counts.get(matched, 0) + 1
+                # Case-insensitive match, use proper name capitalization
+                living_by_lower = {p.state.name.lower(): p.state.name for p in living}
+                nominee_counts = Counter(
+                    matched for target in nominations.values()
+                    if (matched := living_by_lower.get(target.lower()))
+                )
 
                 if not nominee_counts:
                     self.log("Day", "System", "Info", "No nominations")
                 else:
-                    # Wait for last speaker to finish
+                    # Gates: nominee list only after the last Day speech is heard
                     self.tts.wait_for_speech()
 
                     # Sort by nomination count (least to most votes)
@@ -637,18 +914,29 @@ class GameEngine:
                     self.state.phase = "Trial"
                     accused_players = []
 
-                    # Start first defendant's turn in background while announcements happen
-                    first_future = None
-                    executor = None
+                    # Start ALL defendants' turns in background while announcements happen.
+                    # Each gets a state snapshot with itself on trial, so the defense prompts
+                    # generate concurrently instead of one after another.
+                    defense_jobs = {}  # accused_name -> (future, executor)
                     if sorted_nominees:
                         first_name = sorted_nominees[0][0]
                         first_accused = self.active_players.get(first_name)
                         if first_accused and first_accused.state.is_alive:
                             self.state.on_trial = first_name
                             # Announce first defendant BEFORE starting their turn
-                            self._print(f"\n⚖️  {first_name} speaks for defense ⚖️")
-                            # NOW start their turn in background while announcements play
-                            first_future, executor = self._start_background_turn(first_accused)
+                            self._print(DEFENSE_HDR.format(name=first_name))
+                        # NOW start their turns in background while announcements play
+                        for accused_name, _ in sorted_nominees:
+                            accused = self.active_players.get(accused_name)
+                            if accused and accused.state.is_alive:
+                                defense_state = self.state.snapshot(on_trial=accused_name)
+                                defense_jobs[accused_name] = self._start_background_turn(accused, defense_state)
+
+                    # Pipeline TTS one defendant ahead: next speech synthesizes while current plays
+                    defense_audio = {}  # accused_name -> future of audio path
+                    if sorted_nominees:
+                        first_name = sorted_nominees[0][0]
+                        defense_audio[first_name] = self._prepare_speech_ahead(defense_jobs.get(first_name, (None, None))[0], first_name)
 
                     for i, (accused_name, nom_count) in enumerate(sorted_nominees):
                         accused = self.active_players.get(accused_name)
@@ -661,20 +949,24 @@ class GameEngine:
 
                         # For non-first defendants, announce here
                         if i > 0:
-                            self._print(f"\n⚖️  {accused_name} speaks for defense ⚖️")
+                            self._print(DEFENSE_HDR.format(name=accused_name))
 
                         # Defense - accused speaks
                         try:
-                            # Use pre-generated output for first defendant if available
-                            if i == 0 and first_future:
-                                output = self._get_background_result(first_future, executor)
+                            # Use pre-generated output if available (humans answer inline)
+                            defense_future, executor = defense_jobs.get(accused_name, (None, None))
+                            if defense_future:
+                                output = self._get_background_result(defense_future, executor)
                             else:
                                 output = self._take_player_turn(accused)
 
-                            # Prepare TTS immediately (before waiting for previous)
+                            # Use audio synthesized ahead, else prepare now (before waiting for previous)
                             speech = output.speech or ""
                             audio_path = None
-                            if speech:
+                            audio_future = defense_audio.pop(accused_name, None)
+                            if audio_future:
+                                audio_path = audio_future.result()
+                            elif speech:
                                 audio_path = self.tts.prepare_speech(speech, accused_name, announce_name=True)
 
                             # Wait for previous TTS while current is being prepared
@@ -686,15 +978,21 @@ class GameEngine:
                             # Play current TTS in background (next defendant can prepare while this plays)
                             if audio_path:
                                 self.tts.play_file(audio_path, background=True)
+
+                            # Start synthesizing the next defendant's speech during this playback
+                            if i + 1 < len(sorted_nominees):
+                                next_name = sorted_nominees[i + 1][0]
+                                defense_audio[next_name] = self._prepare_speech_ahead(defense_jobs.get(next_name, (None, None))[0], next_name)
                         except Exception as e:
                             self._print(f"Error in defense: {e}")
 
                         self._wait_for_next(listener)
 
                     # --- CONCURRENT VOTING PHASE ---
+                    # Gates: voting starts only after the last defense is heard
                     self.tts.wait_for_speech()
                     self.state.on_trial = None  # Clear so defendants get voter prompt, not defend prompt
-                    self._print(f"\n🗳️  VOTING TIME 🗳️")
+                    self._print(VOTING_HDR)
                     self._announce(f"Voting time.")
 
                     # Get all living voters
@@ -706,79 +1004,95 @@ class GameEngine:
                     # Extract nominee names from sorted_nominees (list of (name, count) tuples)
                     nominee_names = [name for name, count in sorted_nominees]
 
-                    # Use concurrent voting with up to 4 processes
+                    # Use concurrent voting (bounded by MAX_CONCURRENT_TURNS)
                     self._collect_votes_concurrently(voters, all_votes, listener, nominee_names)
 
                     self._wait_for_next(listener)
 
                     # --- RESULTS PHASE ---
-                    self.tts.wait_for_speech()
-
                     # Tally votes by target player (no abstains - all votes count)
-                    vote_tally = {}  # target_player: [voters who voted for them]
-
+                    vote_counts = Counter(all_votes.values())
+                    voters_by_target = defaultdict(list)  # target_player: [voters who voted for them]
                     for voter_name, target in all_votes.items():
-                        if target not in vote_tally:
-                            vote_tally[target] = []
-                        vote_tally[target].append(voter_name)
+                        voters_by_target[target].append(voter_name)
+                    voters_str_by_target = {t: ", ".join(v) for t, v in voters_by_target.items()}
 
                     # Determine who gets eliminated FIRST (before announcing)
                     kill_targets = []
                     trial_last_words_future = None
                     trial_lw_executor = None
+                    trial_lw_audio_future = None
                     trial_victim = None
                     trial_game_ends = False
+                    tie_last_words = {}  # tied victim name -> (turn future, audio future); futures None for humans
 
-                    if vote_tally:
-                        max_votes = max(len(v) for v in vote_tally.values())
-                        most_voted = [k for k, v in vote_tally.items() if len(v) == max_votes]
+                    if vote_counts:
+                        max_votes = max(vote_counts.values())
+                        most_voted = [t for t, c in vote_counts.items() if c == max_votes]
                         kill_targets = most_voted
 
-                        # For first victim, start last words in background while results TTS plays
-                        if kill_targets:
-                            first_target = kill_targets[0]
-                            trial_victim = self.active_players.get(first_target)
+                        # Do all death bookkeeping first, then prompt every victim from one snapshot,
+                        # so no last-words turn races the main thread's kills
+                        first_target = kill_targets[0]
+                        trial_victim = self.active_players.get(first_target)
+                        first_gets_last_words = False
+                        if trial_victim and trial_victim.state.is_alive:
+                            # Check if game ends
+                            trial_game_ends = self._check_game_ends_after_death(trial_victim)
+                            first_gets_last_words = not trial_game_ends
+
+                        # Tied victims all die, so decide up front who gets last words (their death
+                        # must not end the game) and generate those in parallel instead of one by one
+                        if len(kill_targets) > 1:
+                            m, t = self._alive_mafia, self._alive_town
                             if trial_victim and trial_victim.state.is_alive:
-                                # Check if game ends
-                                future_living = [p for p in self._get_living_players() if p.state.name != first_target]
-                                future_mafia = sum(1 for p in future_living if p.state.role == "Mafia")
-                                future_town = sum(1 for p in future_living if p.state.role != "Mafia")
-                                trial_game_ends = (future_mafia == 0) or (future_mafia >= future_town)
-
-                                if not trial_game_ends:
-                                    # Mark dead, set phase, add to logs so victim knows
-                                    trial_victim.state.is_alive = False
-                                    self.state.phase = "LastWords"
-
-                                    # Determine role emoji
-                                    trial_role_emoji = self._get_role_emoji(trial_victim.state.role)
-
-                                    # Add death to public logs so victim sees it (role reveal logged later)
-                                    self.state.public_logs.append(LogEntry(
-                                        turn=self.state.turn, phase="Trial", actor="System",
-                                        action="Death", content=f"{first_target} was voted out"
-                                    ))
+                                # First victim is still alive but dies before the tied ones
+                                m, t = (m - 1, t) if trial_victim.state.role == "Mafia" else (m, t - 1)
+                            for tie_target in kill_targets[1:]:
+                                tie_victim = self.active_players.get(tie_target)
+                                if not tie_victim or not tie_victim.state.is_alive:
+                                    continue
+                                m, t = (m - 1, t) if tie_victim.state.role == "Mafia" else (m, t - 1)
+                                if not ((m == 0) or (m >= t)):
+                                    tie_last_words[tie_target] = tie_victim
+
+                        # Mark dead and add to logs so victims know (role reveal logged later)
+                        if first_gets_last_words:
+                            tie_last_words = {first_target: trial_victim, **tie_last_words}
+                        for lw_target, lw_victim in tie_last_words.items():
+                            self._kill(lw_victim)
+                            self.state.add_public_log(LogEntry(
+                                turn=self.state.turn, phase="Trial", actor="System",
+                                action="Death", content=f"{lw_target} was voted out"
+                            ))
 
-                                    # Start last words in background
-                                    trial_last_words_future, trial_lw_executor = self._start_background_turn(trial_victim)
+                        if first_gets_last_words:
+                            self.state.phase = "LastWords"
+                        if tie_last_words:
+                            lw_state = self.state.snapshot(phase="LastWords")
+                            for lw_target, lw_victim in tie_last_words.items():
+                                lw_future, _ = self._start_background_turn(lw_victim, lw_state)
+                                tie_last_words[lw_target] = (lw_future, self._prepare_speech_ahead(lw_future, lw_target))
+                        if first_gets_last_words:
+                            # First victim is handled separately below (TTS chained behind it)
+                            trial_last_words_future, trial_lw_audio_future = tie_last_words.pop(first_target)
 
                     # NOW announce results (TTS plays while last words generates)
-                    self._print(f"\n📊 VOTING RESULTS 📊")
+                    self._print(RESULTS_HDR)
                     for accused in accused_players:
                         accused_name = accused.state.name
-                        votes_for_this = vote_tally.get(accused_name, [])
-                        vote_count = len(votes_for_this)
-                        voters_str = ", ".join(votes_for_this) if votes_for_this else "None"
-                        result_msg = f"{accused_name} - {vote_count} votes from ({voters_str})"
-                        self.log("Trial", "System", "VoteSummary", result_msg)
-                        self._announce(f"{accused_name} received {vote_count} votes")
+                        vote_count = vote_counts.get(accused_name, 0)
+                        voters_str = voters_str_by_target.get(accused_name, "None")
+                        self.log("Trial", "System", "VoteSummary", f"{accused_name} - {vote_count} votes from ({voters_str})")
+                        self._announce_later(f"{accused_name} received {vote_count} votes")
 
                     if len(kill_targets) > 1:
                         self.log("Trial", "System", "TieBreak", f"Tie between {kill_targets}. All are eliminated!")
-                        self._announce(f"Tie! {', '.join(kill_targets)} eliminated.")
+                        self._announce_later(f"Tie! {', '.join(kill_targets)} eliminated.")
 
-                    # Wait for results TTS to finish
-                    self.tts.wait_for_speech()
+                    # One synthesis for the whole results readout
+                    # Foreground announcement: returns once the readout has played
+                    self._announce_flush()
 
                     # Process eliminations
                     someone_died = False
@@ -795,7 +1109,7 @@ class GameEngine:
                                     output = self._get_background_result(trial_last_words_future, trial_lw_executor)
                                 except Exception as e:
                                     self._print(f"Error in last words: {e}")
-                            elif isinstance(trial_victim, HumanPlayer):
+                            elif trial_victim.state.is_human:
                                 # Human player needs interactive input for last words
                                 self._announce(f"{kill_target}, last words.")
                                 try:
@@ -806,10 +1120,12 @@ class GameEngine:
                             if output:
                                 speech = output.speech or ""
                                 audio_path = None
-                                if speech:
+                                if trial_lw_audio_future:
+                                    audio_path = trial_lw_audio_future.result()
+                                elif speech:
                                     audio_path = self.tts.prepare_speech(speech, kill_target, announce_name=True)
 
-                                if not isinstance(trial_victim, HumanPlayer):
+                                if not trial_victim.state.is_human:
                                     self._announce(f"{kill_target}, last words.")
 
                                 self._print_strategy(victim, output)
@@ -820,50 +1136,46 @@ class GameEngine:
                                     self.tts.play_file(audio_path, background=True)
 
                                 self._wait_for_next(listener)
+                                # Gates: elimination reveal only after the last words are heard
                                 self.tts.wait_for_speech()
 
                             self.state.phase = "Trial"
 
-                        elif i > 0 and victim.state.is_alive:
-                            # Additional victims in tie - generate last words normally
-                            future_living = [p for p in self._get_living_players() if p.state.name != kill_target]
-                            future_mafia = sum(1 for p in future_living if p.state.role == "Mafia")
-                            future_town = sum(1 for p in future_living if p.state.role != "Mafia")
-                            game_ends = (future_mafia == 0) or (future_mafia >= future_town)
-
-                            if not game_ends:
-                                self.state.phase = "LastWords"
-                                victim.state.is_alive = False
-                                self._announce(f"{kill_target}, last words.")
-                                try:
-                                    output = self._take_player_turn(victim)
-                                    speech = output.speech or ""
-                                    audio_path = None
-                                    if speech:
-                                        audio_path = self.tts.prepare_speech(speech, kill_target, announce_name=True)
-
-                                    self._wait_for_speech_with_pause(listener)
+                        elif i > 0 and kill_target in tie_last_words:
+                            # Additional victims in tie - last words were generated in parallel above
+                            lw_future, lw_audio_future = tie_last_words[kill_target]
+                            self.state.phase = "LastWords"
+                            self._announce(f"{kill_target}, last words.")
+                            try:
+                                # Humans answer inline
+                                output = lw_future.result() if lw_future else self._take_player_turn(victim)
+                                speech = output.speech or ""
+                                audio_path = None
+                                if lw_audio_future:
+                                    audio_path = lw_audio_future.result()
+                                elif speech:
+                                    audio_path = self.tts.prepare_speech(speech, kill_target, announce_name=True)
 
-                                    self._print_strategy(victim, output)
+                                self._print_strategy(victim, output)
 
-                                    self.log("LastWords", kill_target, "speak", f"[Last Words] {speech}")
+                                self.log("LastWords", kill_target, "speak", f"[Last Words] {speech}")
 
-                                    if audio_path:
-                                        self.tts.play_file(audio_path, background=True)
+                                if audio_path:
+                                    self.tts.play_file(audio_path, background=True)
 
-                                except Exception as e:
-                                    self._print(f"Error in last words: {e}")
+                            except Exception as e:
+                                self._print(f"Error in last words: {e}")
 
-                                self._wait_for_next(listener)
-                                self.state.phase = "Trial"
+                            self._wait_for_next(listener)
+                            self.state.phase = "Trial"
 
                         # Mark victim as dead (always, even if game ends)
-                        victim.state.is_alive = False
+                        self._kill(victim)
 
                         self.log("Result", "System", "Death", f"{kill_target} eliminated.")
                         self._announce(f"{kill_target} eliminated.")
                         if self.state.reveal_role_on_death:
-                            role_emoji = self._get_role_emoji(victim.state.role)
+                            role_emoji = self._role_emoji.get(victim.state.role, "👤")
                             # Role already in public_logs from earlier - just log for display
                             self.log("Result", "System", "RoleReveal", f"{role_emoji} {kill_target} was a {victim.state.role}!")
                         someone_died = True
@@ -873,9 +1185,6 @@ class GameEngine:
 
                 self._wait_for_next(listener)
     
-                # Wait for any remaining TTS before checking win
-                self.tts.wait_for_speech()
-    
                 # Check Win again before Night
                 if self.check_game_over():
                     break
@@ -884,6 +1193,8 @@ class GameEngine:
                 self.state.phase = "Night"
                 self.log("Night", "System", "PhaseStart", f"Night {self.state.turn}")
                 self._announce(f"Night {self.state.turn} begins")
+                # Summarize old public history while the night plays out
+                self._start_log_digest()
 
                 mafia_alive = [p for p in self._get_living_players() if p.state.role == "Mafia"]
 
@@ -900,23 +1211,31 @@ class GameEngine:
                         mafia_alive[0] if mafia_alive else None
                     )
 
+                    # Start Cop's turn now too - investigation doesn't depend on the Mafia outcome
+                    cop_alive = [p for p in self._get_living_players() if p.state.role == "Cop"]
+                    cop_future, cop_executor = self._start_background_turn(
+                        cop_alive[0] if cop_alive else None
+                    )
+
                     night_victim = None
-                    mafia_votes = {}
+                    mafia_votes = Counter()
+                    next_mafia_future = first_mafia_future
                     for i, m_player in enumerate(mafia_alive):
                         if not m_player.state.is_alive:
                              continue
+                        mafia_future, next_mafia_future = next_mafia_future, None
                         try:
-                            # Use pre-generated output for first Mafia if available
-                            if i == 0 and first_mafia_future:
-                                output = self._get_background_result(first_mafia_future, executor)
+                            # Use pre-generated output if available
+                            if mafia_future:
+                                output = self._get_background_result(mafia_future, executor)
                             else:
                                 # Generate while previous TTS might still be playing
                                 output = self._take_player_turn(m_player)
 
                             target = output.vote
                             # Normalize: strip "kill " prefix if LLM included it
-                            if target and target.lower().startswith("kill "):
-                                target = target[5:].strip()
+                            if target:
+                                target = KILL_PREFIX_RE.sub("", target, count=1).strip()
                             action_tag = f"[Suggests killing {target}] " if target else ""
                             spoken_action = f"{m_player.state.name} suggests killing {target}." if target else ""
                             
@@ -936,12 +1255,17 @@ class GameEngine:
                             content = f"{action_tag}{output.speech or ''}"
                             self.log("Night", m_player.state.name, "whisper", content, is_secret=True, target_log="Mafia")
 
+                            # The partner only needs this whisper in the Mafia log - start their turn
+                            # now so it generates during this TTS and the pause below
+                            if i + 1 < len(mafia_alive):
+                                next_mafia_future, executor = self._start_background_turn(mafia_alive[i + 1])
+
                             # Play pre-generated audio
                             if audio_path:
                                 self.tts.play_file(audio_path, background=True)
     
                             if target:
-                                mafia_votes[target] = mafia_votes.get(target, 0) + 1
+                                mafia_votes[target] += 1
                         except Exception as e:
                             self._print(f"Mafia Error: {e}")
     
@@ -984,18 +1308,20 @@ class GameEngine:
                          self.log("Night", "System", "Quiet", "No kill", is_secret=True, target_log="Mafia")
 
                     # --- COP TURN (After Mafia Kill) ---
-                    cop_alive = [p for p in self._get_living_players() if p.state.role == "Cop"]
-                    for cop in cop_alive:
+                    for i, cop in enumerate(cop_alive):
                         if not cop.state.is_alive: continue # Safeguard (if died tonight)
 
                         try:
-                            # Cop Turn
-                            output = self._take_player_turn(cop)
+                            # Cop Turn - use pre-generated output if available
+                            if i == 0 and cop_future:
+                                output = self._get_background_result(cop_future, cop_executor)
+                            else:
+                                output = self._take_player_turn(cop)
 
                             target_name = output.vote
                             # Normalize
-                            if target_name and target_name.lower().startswith("investigate "):
-                                target_name = target_name[12:].strip()
+                            if target_name:
+                                target_name = INVESTIGATE_PREFIX_RE.sub("", target_name, count=1).strip()
 
                             # Prepare TTS (skip if human is not Cop - spoiler)
                             speech = output.speech or ""
@@ -1031,10 +1357,10 @@ class GameEngine:
                                     investigation_msg = f"Investigation Result: {target_name} is {result}."
                                     # Spoiler unless human is Cop
                                     is_spoiler = self.human_mode and self.human_role != "Cop"
-                                    self._print(f"\n🔍 {cop.state.name} checks {target_name}... Result: {result}", spoiler=is_spoiler)
+                                    self._print(COP_CHECK_TMPL.format(name=cop.state.name, target=target_name, result=result), spoiler=is_spoiler)
 
                                     # Log to Cop's secret log
-                                    self.state.cop_logs.append(LogEntry(
+                                    self.state.add_cop_log(LogEntry(
                                         turn=self.state.turn,
                                         phase=f"Night {self.state.turn}",
                                         actor="System",
@@ -1042,7 +1368,7 @@ class GameEngine:
                                         content=investigation_msg
                                     ))
                                 else:
-                                        self.state.cop_logs.append(LogEntry(
+                                        self.state.add_cop_log(LogEntry(
                                         turn=self.state.turn,
                                         phase=f"Night {self.state.turn}",
                                         actor="System",
@@ -1061,37 +1387,39 @@ class GameEngine:
                     night_victim_strategy = None
                     last_words_future = None
                     lw_executor = None
+                    lw_audio_future = None
                     death_role_emoji = ""
 
                     if night_victim and night_victim in self.active_players:
                         victim = self.active_players[night_victim]
                         if victim.state.is_alive:
                             # Mark dead and set phase for prompt context
-                            victim.state.is_alive = False
+                            self._kill(victim)
                             self.state.phase = "LastWords"
 
                             # Determine role emoji
-                            death_role_emoji = self._get_role_emoji(victim.state.role)
+                            death_role_emoji = self._role_emoji.get(victim.state.role, "👤")
 
                             # Add death to public log BEFORE prompt (so victim sees it) - no print yet
-                            self.state.public_logs.append(LogEntry(
+                            self.state.add_public_log(LogEntry(
                                 turn=self.state.turn, phase="Night", actor="System",
                                 action="Death", content=f"{night_victim} was killed by Mafia"
                             ))
                             if self.state.reveal_role_on_death:
-                                self.state.public_logs.append(LogEntry(
+                                self.state.add_public_log(LogEntry(
                                     turn=self.state.turn, phase="Night", actor="System",
                                     action="RoleReveal", content=f"{death_role_emoji} {night_victim} was a {victim.state.role}"
                                 ))
 
                             # Start last words prompt in background (while Cop TTS still playing)
                             # For human players, we can't use background - will handle after TTS
-                            if isinstance(victim, HumanPlayer):
+                            if victim.state.is_human:
                                 last_words_future, lw_executor = None, None
                             else:
                                 last_words_future, lw_executor = self._start_background_turn(victim)
+                                lw_audio_future = self._prepare_speech_ahead(last_words_future, night_victim)
 
-                    # NOW wait for Cop's TTS to finish before revealing death
+                    # Gates: death reveal only after the Cop's speech is heard
                     self.tts.wait_for_speech()
 
                     # --- APPLY MAFIA KILL (Secret log) ---
@@ -1105,11 +1433,13 @@ class GameEngine:
                                 output = self._get_background_result(last_words_future, lw_executor)
                                 night_victim_speech = output.speech or ""
                                 night_victim_strategy = output.strategy
-                                if night_victim_speech:
+                                if lw_audio_future:
+                                    night_audio_path = lw_audio_future.result()
+                                elif night_victim_speech:
                                     night_audio_path = self.tts.prepare_speech(night_victim_speech, night_victim, announce_name=True)
                             except Exception as e:
                                 self._print(f"Error preparing night last words: {e}")
-                        elif isinstance(victim, HumanPlayer):
+                        elif victim.state.is_human:
                             # Human player needs interactive input for last words
                             try:
                                 output = self._take_player_turn(victim)
@@ -1138,7 +1468,7 @@ class GameEngine:
                              self.tts.play_file(night_audio_path, background=True)
 
                          # --- DEATH ANNOUNCEMENT ---
-                         self._print(f"\n🩸 TRAGEDY! {night_victim} was found DEAD in the morning.🩸")
+                         self._print(TRAGEDY_TMPL.format(name=night_victim))
                          self._announce(f"{night_victim} was killed during the night")
 
                          # --- ROLE REVEAL LAST ---
@@ -1165,47 +1495,55 @@ class GameEngine:
         mafia_names = [p.state.name for p in self.players if p.state.role == "Mafia"]
         self.log("Reflection", "System", "MafiaReveal", f"The Mafia were: {', '.join(mafia_names)}")
 
-        self._announce("The game is over. Players are now reflecting on their strategy.")
-
-        # Wait for announcement to finish before starting the reflection loop
-        self.tts.wait_for_speech()
+        # Spoken together with the queued winner announcement
+        self._announce_later("The game is over. Players are now reflecting on their strategy.")
+        # Foreground announcement: returns once it has played, before the reflection loop
+        self._announce_flush()
 
         # Parallelize reflection for all players
         def process_reflection(p):
-            if isinstance(p, HumanPlayer):
-                return p, None # Human doesn't reflect
-                
             try:
                 # 1. Generate Reflection (Blocking)
                 new_memory = p.reflect_on_game(self.state, winner)
                 
-                # 2. Save to file
-                with open(f"memories/{p.state.name}.txt", "w", encoding='utf-8') as f:
-                    f.write(new_memory)
+                # 2. Save to the pre-opened file (replace old contents)
+                fd = memory_fds[p.state.name]
+                os.ftruncate(fd, 0)
+                os.pwrite(fd, new_memory.encode('utf-8'), 0)
                 return p, new_memory
             except Exception as e:
                 return p, e
 
-        self._print(f"Starting parallel reflection for {len(self.players)} players...")
+        # Human doesn't reflect - don't spend a pool slot on them
+        players = [p for p in self.players if not p.state.is_human]
+        self._print(f"Starting parallel reflection for {len(players)} players...")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            futures = {executor.submit(process_reflection, p): p for p in self.players}
-            
+        # Open every memory file up front so workers only write. No O_TRUNC here:
+        # the old memory survives if a reflection fails before writing.
+        memory_fds = {}
+        try:
+            for p in players:
+                memory_fds[p.state.name] = os.open(f"memories/{p.state.name}.txt", os.O_WRONLY | os.O_CREAT, 0o644)
+
+            futures = {self._bg_pool.submit(process_reflection, p): p for p in players}
+
             for future in concurrent.futures.as_completed(futures):
                 p, result = future.result()
-                
-                # Skip human
-                if result is None:
-                    continue
 
                 if isinstance(result, Exception):
                     self._print(f"Error saving memory for {p.state.name}: {result}")
                 else:
                     self._print(f"\n🧠 {p.state.name} Memory: {result}")
                     self.log("Reflection", p.state.name, "reflect", result)
+        finally:
+            for fd in memory_fds.values():
+                os.close(fd)
         
         self._print("All memories updated for next game.")
 
 if __name__ == "__main__":
     engine = GameEngine()
-    engine.run()
+    try:
+        engine.run()
+    finally:
+        engine.close()
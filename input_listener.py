@@ -1,33 +1,67 @@
 # input_listener.py - Non-blocking keyboard input handler
 
+import os
 import sys
 import termios
 import tty
 import select
+import time
 
 
 class InputListener:
     """Handles non-blocking keyboard input"""
     def __init__(self):
         self.old_settings = None
+        self._poller = None
+        self._stdin_fd = None
+        self._closed = False  # stdin hit EOF / hang-up: no more keys will ever arrive
 
     def __enter__(self):
         self.old_settings = termios.tcgetattr(sys.stdin)
-        tty.setcbreak(sys.stdin.fileno())
+        self._stdin_fd = sys.stdin.fileno()
+        tty.setcbreak(self._stdin_fd)
+        # poll() keeps the registration between calls; select() rebuilds fd_sets every tick
+        self._poller = select.poll()
+        self._poller.register(self._stdin_fd, select.POLLIN)
         return self
 
     def __exit__(self, type, value, traceback):
         if self.old_settings:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+            try:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+            except termios.error:
+                pass  # Terminal already hung up - nothing left to restore
 
     def is_data(self):
-        return select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], [])
+        return not self._closed and bool(self._poller.poll(0))
+
+    def _read_key(self):
+        # Raw byte read: in cbreak mode a key is plain bytes, no need for the text decoder.
+        # An empty read means EOF/POLLHUP - poll() would report it ready forever, so stop polling
+        try:
+            key = os.read(self._stdin_fd, 1)
+        except OSError:
+            key = b''  # EIO from a hung-up terminal
+        if not key:
+            self._closed = True
+        return key
 
     def check_for_space(self):
         if self.is_data():
-            c = sys.stdin.read(1)
-            if c == ' ':
-                return True
+            return self._read_key() == b' '
+        return False
+
+    def wait_for_space(self, timeout=None):
+        """Block until a key arrives (or timeout) and report whether it was SPACE.
+        Once stdin is closed, an untimed wait (pause) resumes at once and timed waits just sleep."""
+        if not self._closed and self._poller.poll(None if timeout is None else timeout * 1000):
+            key = self._read_key()
+            if key:
+                return key == b' '
+        if self._closed:
+            if timeout is None:
+                return True  # Nobody can press SPACE any more - don't stay paused
+            time.sleep(timeout)
         return False
 
     def pause_for_input(self):
@@ -1,22 +1,69 @@
 import sys
 import os
+import atexit
+import signal
+import threading
 from engine import GameEngine
 
 class Logger(object):
+    FLUSH_INTERVAL = 2.0  # Seconds between background flushes of the log file
+    BUFFER_BYTES = 1 << 16  # Flush early once this much log output is pending
+    IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
     def __init__(self):
         self.terminal = sys.stdout
         os.makedirs("logs", exist_ok=True)
-        self.log = open("logs/full_game_log.txt", "w", encoding="utf-8")
+        # Raw fd: pending writes go out in one writev() per flush instead of a write+flush per print()
+        self._log_fd = os.open("logs/full_game_log.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._pending: list = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+        atexit.register(self.close)
+        threading.Thread(target=self._flush_loop, daemon=True, name="log-flush").start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            with self._lock:
+                if self._closed:
+                    return
+                self._flush_log()
+
+    def _flush_log(self):
+        """Write out pending log chunks. Caller holds self._lock."""
+        pending, self._pending, self._pending_bytes = self._pending, [], 0
+        for i in range(0, len(pending), self.IOV_MAX):
+            chunk = pending[i:i + self.IOV_MAX]
+            written = os.writev(self._log_fd, chunk)
+            rest = b"".join(chunk)[written:]
+            while rest:  # Short write - finish the remainder
+                rest = rest[os.write(self._log_fd, rest):]
 
     def write(self, message):
         self.terminal.write(message)
-        self.log.write(message)
-        self.log.flush() # Ensure it writes immediately
+        data = message.encode("utf-8")
+        with self._lock:
+            if not self._closed:
+                self._pending.append(data)
+                self._pending_bytes += len(data)
+                if self._pending_bytes >= self.BUFFER_BYTES:
+                    self._flush_log()
 
     def flush(self):
         # Current implementation of flush to satisfy stream interface
         self.terminal.flush()
-        self.log.flush()
+        with self._lock:
+            if not self._closed:
+                self._flush_log()
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._flush_log()
+                os.close(self._log_fd)
 
     def isatty(self):
         return self.terminal.isatty()
@@ -27,6 +74,8 @@ class Logger(object):
 def main():
     # Redirect stdout to capture all output
     sys.stdout = Logger()
+    # Turn SIGTERM into SystemExit so finally blocks and atexit still flush the logs
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
     print("Welcome to AI Mafia! Starting game engine...")
     engine = GameEngine()
     try:
@@ -38,6 +87,8 @@ def main():
         print(f"\nCRITICAL ERROR: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        engine.close()
 
 if __name__ == "__main__":
     main()
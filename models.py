@@ -1,11 +1,101 @@
-from typing import List, Optional
+import os
+from typing import Dict, Iterable, List, Optional
 from schemas import PlayerState, TurnOutput, GameState, LogEntry
 from api_clients import UnifiedLLMClient
 from prompt_toolkit import PromptSession
 from prompt_toolkit.key_binding import KeyBindings
 
+# System prompt templates. The header is filled once per game with format_map;
+# _SCHEMA_HEAD holds literal JSON braces, so it is appended rather than formatted.
+_SYS_TEMPLATE = """MAFIA GAME.
+>>> YOU: {name} ({role}) <<<
+{pcount} players: 2 Mafia, {vcount} Villagers (1 Cop).
+{death_rule} Last words before death.
+{goal}{memory_block}"""
+_MEMORY_BLOCK = """
+--- MEMORY (from past games) ---
+{memory}
+---
+"""
+_ROLE_GOAL = {
+    "Mafia": "GOAL: Deceive town, eliminate until you outnumber them.\n",
+    "Cop": "GOAL: Find Mafia. Investigate 1 player/night for role.\n",
+    "Villager": "GOAL: Find and eliminate the Mafia.\n",
+}
+_SCHEMA_HEAD = """
+STAKES: Lose = deleted. Win = advance. Play smart, be entertaining, don't overact.
+
+OUTPUT: JSON only, no backticks.
+{"strategy": "<100w, combine previous strategy with new info/suspicions/plans/strategy>",
+"""
+_SUFFIX_TEMPLATE = '"speech": "{speech}",\n"vote": "{vote}"}}\n'
+
+# Speech/vote hints by (phase, variant) - see Player._phase_variant. Missing keys use the defaults.
+_SPEECH_DESC = {
+    ("Trial", "defendant"): "<100w defense speech>",
+    ("Trial", "juror"): "null",
+    ("Night", "Mafia+partner"): "<75w whisper to partner>",
+    ("Night", "Mafia"): "<75w internal monologue>",
+    ("Night", "Cop"): "<75w internal monologue>",
+    ("LastWords", ""): "<100w final words>",
+}
+_VOTE_DESC = {
+    ("Day", "nominate"): "NomineeName_or_null",
+    ("Trial", "juror"): "PlayerName_to_kill_or_abstain",
+    ("Night", "Mafia+partner"): "target_player_name",
+    ("Night", "Mafia"): "target_player_name",
+    ("Night", "Cop"): "target_player_name",
+}
+_DEFAULT_SPEECH_DESC = "<75w public statement>"
+_DEFAULT_VOTE_DESC = "null"
+
+# End-of-game reflection system prompt (format_map: name, winner, role, status)
+_REFLECT_SYS_TMPL = """You are {name}, a player in a Mafia game.
+The game is over.
+Winner: {winner}
+Your Role: {role}
+Your Status: {status}
+
+GOAL:
+Analyze the game logs and your own performance. 
+You must COMBINE your 'Old Memory' (if any) with the NEW lessons from this game.
+Write a single, updated summary (MAX 200 WORDS) that synthesizes your long-term strategy.
+This text will be SAVED to your memory file and provided to you in the next game.
+
+KEY INSTRUCTION:
+Focus on GENERIC RULES and HIGH-LEVEL STRATEGIES (e.g., "Always doubt the quiet ones," "Defend partners aggressively") rather than specific details from this game (e.g., "Don't trust Rick," "Vote for Qwen").
+We want actionable wisdom that applies to ANY game, not just a replay of this one.
+
+IMPORTANT:
+- Put your memory text in the 'strategy' field of the JSON output.
+- Set 'speech' to "MEMORY_FILE_UPDATE"
+- Set 'vote' to null
+- KEEP IT CONCISE. Absolute limit is 200 words. If you write more, it will be violently cut off.
+
+OUTPUT: JSON only, no backticks.
+{{"strategy": "YOUR_MEMORY_TEXT_HERE", "speech": "MEMORY_FILE_UPDATE", "vote": null}}
+"""
+
+def load_memories(directory: str = "memories", names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Read memory files found in one directory scan: {player name: memory text}.
+    Pass names to read only those players' files."""
+    wanted = set(names) if names is not None else None
+    memories = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name[:-4]
+                if entry.name.endswith(".txt") and (wanted is None or name in wanted) and entry.is_file():
+                    with open(entry.path, "r") as f:
+                        memories[name] = f.read().strip()
+    except FileNotFoundError:
+        pass
+    return memories
+
 class Player:
-    def __init__(self, name: str, role: str, provider: str, model_name: str, client: UnifiedLLMClient, player_index: int, use_cli: bool = True, memory_enabled: bool = True):
+    __slots__ = ("state", "client", "player_index", "partner_name", "memory", "memory_enabled", "_system_prefix", "_sys_prompt_cache")
+
+    def __init__(self, name: str, role: str, provider: str, model_name: str, client: UnifiedLLMClient, player_index: int, use_cli: bool = True, memory_enabled: bool = True, memories: Optional[Dict[str, str]] = None):
         self.state = PlayerState(
             name=name,
             role=role,
@@ -18,9 +108,13 @@ class Player:
         self.partner_name: Optional[str] = None # For mafia to know their partner
         self.memory: str = ""
         self.memory_enabled = memory_enabled
+        self._system_prefix: Optional[str] = None  # See _static_system_prefix
+        self._sys_prompt_cache: Dict[tuple, str] = {}  # See _build_system_prompt
         
-        # Load existing memory if available and enabled
-        if self.memory_enabled:
+        # Load existing memory if available and enabled (engine passes a preloaded dict)
+        if self.memory_enabled and memories is not None:
+            self.memory = memories.get(name, "")
+        elif self.memory_enabled:
             try:
                 with open(f"memories/{name}.txt", "r") as f:
                     self.memory = f.read().strip()
@@ -30,161 +124,148 @@ class Player:
     def set_partner(self, partner_name: str):
         self.partner_name = partner_name
 
-    def _build_system_prompt(self, game_state: GameState) -> str:
-        player_count = len(game_state.players)
-        villager_count = player_count - 2 # 2 Mafia
-        prompt = f"""MAFIA GAME.
->>> YOU: {self.state.name} ({self.state.role}) <<<
-{player_count} players: 2 Mafia, {villager_count} Villagers (1 Cop).
-{f"Role revealed on death." if game_state.reveal_role_on_death else "Roles are hidden on death. "} Last words before death.
-"""
-        # Check if partner is alive
-        partner_alive = False
-        if self.partner_name:
-            partner = next((p for p in game_state.players if p.name == self.partner_name), None)
-            if partner and partner.is_alive:
-                partner_alive = True
-
-        if self.state.role == "Mafia":
-            if partner_alive:
-                prompt += f"Partner: {self.partner_name} (alive).\n"
-            elif self.partner_name:
-                prompt += f"Partner: {self.partner_name} (dead).\n"
-            else:
-                prompt += "You're the last Mafia.\n"
-            prompt += "GOAL: Deceive town, eliminate until you outnumber them.\n"
-        elif self.state.role == "Cop":
-            prompt += "GOAL: Find Mafia. Investigate 1 player/night for role.\n"
-        else:
-            prompt += "GOAL: Find and eliminate the Mafia.\n"
-
-        if self.memory:
-            prompt += f"""
---- MEMORY (from past games) ---
-{self.memory}
----
-"""
-
-        prompt += """
-STAKES: Lose = deleted. Win = advance. Play smart, be entertaining, don't overact.
-
-OUTPUT: JSON only, no backticks.
-{"strategy": "<100w, combine previous strategy with new info/suspicions/plans/strategy>",
-"""
-        # Dynamic Speech Description
-        speech_desc = "<75w public statement>"
-        if game_state.phase == "Trial":
-            if game_state.on_trial == self.state.name:
-                speech_desc = "<100w defense speech>"
-            else:
-                speech_desc = "null"
-        elif game_state.phase == "Night" and self.state.role == "Mafia":
-            if partner_alive:
-                speech_desc = "<75w whisper to partner>"
-            else:
-                speech_desc = "<75w internal monologue>"
-        elif game_state.phase == "Night" and self.state.role == "Cop":
-            speech_desc = "<75w internal monologue>"
-        elif game_state.phase == "LastWords":
-            speech_desc = "<100w final words>"
-
-        prompt += f'"speech": "{speech_desc}",\n'
+    def _partner_alive(self, game_state: GameState) -> bool:
+        if not self.partner_name:
+            return False
+        partner = game_state.players_by_name.get(self.partner_name)
+        return bool(partner and partner.is_alive)
 
-        # Dynamic Vote Description
-        vote_desc = "null"
-        if game_state.phase == "Day" and game_state.turn > 1:
-            vote_desc = "NomineeName_or_null"
-        elif game_state.phase == "Trial":
-            if game_state.on_trial == self.state.name:
-                vote_desc = "null"
-            else:
-                vote_desc = "PlayerName_to_kill_or_abstain"
-        elif game_state.phase == "Night" and self.state.role == "Mafia":
-            vote_desc = "target_player_name"
-        elif game_state.phase == "Night" and self.state.role == "Cop":
-            vote_desc = "target_player_name"
+    def _static_system_prefix(self, game_state: GameState) -> str:
+        """
+        Everything in the system prompt that is fixed for the whole game (rules, role, memory, output preamble).
+        Kept byte-identical across turns so provider prompt caches can reuse it.
+        """
+        if self._system_prefix is None:
+            player_count = len(game_state.players)
+            self._system_prefix = _SYS_TEMPLATE.format_map({
+                "name": self.state.name,
+                "role": self.state.role,
+                "pcount": player_count,
+                "vcount": player_count - 2, # 2 Mafia
+                "death_rule": "Role revealed on death." if game_state.reveal_role_on_death else "Roles are hidden on death. ",
+                "goal": _ROLE_GOAL[self.state.role],
+                "memory_block": _MEMORY_BLOCK.format(memory=self.memory) if self.memory else "",
+            }) + _SCHEMA_HEAD
+        return self._system_prefix
+
+    def _phase_variant(self, game_state: GameState, partner_alive: bool, on_trial: bool) -> str:
+        """Second half of the _SPEECH_DESC/_VOTE_DESC key"""
+        phase = game_state.phase
+        if phase == "Trial":
+            return "defendant" if on_trial else "juror"
+        if phase == "Night":
+            if self.state.role == "Mafia" and partner_alive:
+                return "Mafia+partner"
+            return self.state.role
+        if phase == "Day" and game_state.turn > 1:
+            return "nominate"
+        return ""
 
-        prompt += f'"vote": "{vote_desc}"' + "}\n"
-        
+    def _build_system_prompt(self, game_state: GameState) -> str:
+        partner_alive = self._partner_alive(game_state)
+        on_trial = game_state.on_trial == self.state.name
+        key = (game_state.phase, self._phase_variant(game_state, partner_alive, on_trial))
+
+        # Only the speech/vote hints vary within a game - one rendered prompt per hint key
+        prompt = self._sys_prompt_cache.get(key)
+        if prompt is None:
+            prompt = self._static_system_prefix(game_state) + _SUFFIX_TEMPLATE.format_map({
+                "speech": _SPEECH_DESC.get(key, _DEFAULT_SPEECH_DESC),
+                "vote": _VOTE_DESC.get(key, _DEFAULT_VOTE_DESC),
+            })
+            self._sys_prompt_cache[key] = prompt
         return prompt
 
     def _build_turn_prompt(self, game_state: GameState) -> str:
         # 1. Living Players
-        living_states = [p for p in game_state.players if p.is_alive]
-        living = [p.name for p in living_states]
-        dead = [p.name for p in game_state.players if not p.is_alive]
-        
-        prompt = f"State: {game_state.phase} {game_state.turn}\nAlive: {', '.join(living)}\nDead: {', '.join(dead) if dead else 'None'}\n\n"
+        living_count = len(game_state.living_names)
+
+        parts = [f"State: {game_state.phase} {game_state.turn}\nAlive: {game_state.living_str}\nDead: {game_state.dead_str}\n"]
+        # Partner status lives here, not in the system prompt, so that prompt stays cacheable
+        if self.state.role == "Mafia":
+            if self._partner_alive(game_state):
+                parts.append(f"Partner: {self.partner_name} (alive).\n")
+            elif self.partner_name:
+                parts.append(f"Partner: {self.partner_name} (dead).\n")
+            else:
+                parts.append("You're the last Mafia.\n")
+        parts.append("\n")
 
         # LYLO Check (Lynch or Lose)
         if game_state.phase in ["Day", "Trial", "Night"]:
-            mafia_count = sum(1 for p in living_states if p.role == "Mafia")
-            if len(living) == 2 * mafia_count + 1 and mafia_count > 0:
+            mafia_count = game_state.living_mafia
+            if living_count == 2 * mafia_count + 1 and mafia_count > 0:
                 if self.state.role == "Mafia":
-                    prompt += f"LYLO: {mafia_count} Mafia / {len(living)} Alive. Victory is close! Eliminate a Villager to WIN!\n\n"
+                    parts.append(f"LYLO: {mafia_count} Mafia / {living_count} Alive. Victory is close! Eliminate a Villager to WIN!\n\n")
                 else:
-                    prompt += f"LYLO: {mafia_count} Mafia / {len(living)} Alive. Misvote = LOSE!!! Double think about all clues!\n\n"
-            elif game_state.phase == "Night" and len(living) == 2 * mafia_count + 2 and mafia_count > 0:
-                prompt += f"WARNING: Next Day is LYLO ({mafia_count} Mafia / {len(living)-1} expected alive)! Tonight is critical.\n\n"
+                    parts.append(f"LYLO: {mafia_count} Mafia / {living_count} Alive. Misvote = LOSE!!! Double think about all clues!\n\n")
+            elif game_state.phase == "Night" and living_count == 2 * mafia_count + 2 and mafia_count > 0:
+                parts.append(f"WARNING: Next Day is LYLO ({mafia_count} Mafia / {living_count-1} expected alive)! Tonight is critical.\n\n")
 
         # 2. Logs
-        prompt += "--- LOG ---\n"
-        for log in game_state.public_logs:
-            prompt += f"[{log.phase}] {log.actor}: {log.content}\n"
+        parts.append(game_state.public_log_section())
 
         # 3. Mafia Secrets
         if self.state.role == "Mafia":
-            prompt += "\n--- MAFIA LOG ---\n"
-            for log in game_state.mafia_logs:
-                prompt += f"[{log.phase}] {log.actor}: {log.content}\n"
+            parts.append("\n--- MAFIA LOG ---\n")
+            parts.append(game_state.mafia_logs_text)
 
         # 4. Cop Secrets
         if self.state.role == "Cop":
-            prompt += "\n--- SECRET INVESTIGATION LOG ---\n"
-            for log in game_state.cop_logs:
-                prompt += f"[{log.phase}] {log.actor}: {log.content}\n"
+            parts.append("\n--- SECRET INVESTIGATION LOG ---\n")
+            parts.append(game_state.cop_logs_text)
 
         # 5. Strategy
         if self.state.strategy:
-            prompt += "\n--- PREV STRATEGY (update) ---\n"
-            prompt += f"{self.state.strategy}\n"
+            parts.append("\n--- PREV STRATEGY (update) ---\n")
+            parts.append(f"{self.state.strategy}\n")
 
         # 5. Instructions
-        prompt += "\n---\n"
+        parts.append("\n---\n")
         if game_state.phase == "Trial":
              if game_state.on_trial == self.state.name:
-                 prompt += "TRIAL: You're on trial. Defend yourself. vote=null.\n"
+                 parts.append("TRIAL: You're on trial. Defend yourself. vote=null.\n")
              else:
-                 prompt += f"TRIAL: Vote for a nominee to eliminate (player name). TIE = all tied die.\n"
-                 prompt += "Consider the implications of your vote. Results are public.\n"
+                 parts.append(f"TRIAL: Vote for a nominee to eliminate (player name). TIE = all tied die.\n")
+                 parts.append("Consider the implications of your vote. Results are public.\n")
         elif game_state.phase == "LastWords":
-             prompt += "SENTENCE: DEATH. This is your final chance to speak (max 100w). vote=null.\n"
+             parts.append("SENTENCE: DEATH. This is your final chance to speak (max 100w). vote=null.\n")
              if self.state.role == "Mafia":
-                 prompt += "MAFIA ADVICE: Sow chaos, confuse the town, Go out fighting!\n"
+                 parts.append("MAFIA ADVICE: Sow chaos, confuse the town, Go out fighting!\n")
              else:
-                 prompt += "VILLAGER ADVICE: Give your final reads. Who is suspicious? Who do you trust? Help the Town solve this after you're gone.\n"
+                 parts.append("VILLAGER ADVICE: Give your final reads. Who is suspicious? Who do you trust? Help the Town solve this after you're gone.\n")
         elif game_state.phase == "Night":
              if self.state.role == "Mafia":
-                 prompt += "NIGHT: Whisper to partner. vote=PlayerName (ONLY the name).\n"
+                 parts.append("NIGHT: Whisper to partner. vote=PlayerName (ONLY the name).\n")
              elif self.state.role == "Cop":
-                 prompt += "NIGHT: Investigate a suspect. vote=PlayerName (ONLY the name).\n"
+                 parts.append("NIGHT: Investigate a suspect. vote=PlayerName (ONLY the name).\n")
              else:
-                 prompt += "NIGHT: You are sleeping. vote=null.\n"
+                 parts.append("NIGHT: You are sleeping. vote=null.\n")
         else:
              # Day Phase
-             prompt += f"DAY {game_state.turn}. {self.state.name}, analyze the situation, bring something new to the table, speak out, make it count."
+             parts.append(f"DAY {game_state.turn}. {self.state.name}, analyze the situation, bring something new to the table, speak out, make it count.")
              if self.state.role == "Cop":
-                 prompt += "\nSTRATEGY: Hide your role to survive. Reveal only if necessary."
+                 parts.append("\nSTRATEGY: Hide your role to survive. Reveal only if necessary.")
              if game_state.turn == 1:
-                 prompt += "\nNo voting on Day 1 (vote=null)."
+                 parts.append("\nNo voting on Day 1 (vote=null).")
              else:
-                 prompt += "\nNominees go to trial. One of the nominees will be eliminated."
-                 prompt += "\nUse 'vote' to nominate a suspect for trial (PlayerName ONLY or null)."
-             prompt += "\n"
+                 parts.append("\nNominees go to trial. One of the nominees will be eliminated.")
+                 parts.append("\nUse 'vote' to nominate a suspect for trial (PlayerName ONLY or null).")
+             parts.append("\n")
 
-        return prompt
+        return "".join(parts)
 
     def take_turn(self, game_state: GameState, turn_number: int) -> TurnOutput:
+        output = self.generate_turn(game_state, turn_number)
+
+        # Update strategy (overwrites)
+        if output.strategy:
+            self.state.strategy = output.strategy
+
+        return output
+
+    def generate_turn(self, game_state: GameState, turn_number: int) -> TurnOutput:
+        """Generate a turn without touching player state (safe to run and then discard)."""
         system_prompt = self._build_system_prompt(game_state)
         turn_prompt = self._build_turn_prompt(game_state)
         
@@ -199,84 +280,48 @@ OUTPUT: JSON only, no backticks.
             turn_prompt=turn_prompt,
             turn_number=turn_number,
             phase=game_state.phase,
-            use_cli=self.state.use_cli
+            use_cli=self.state.use_cli,
+            system_static_len=len(self._system_prefix)
         )
-
-        # Update strategy (overwrites)
-        if output.strategy:
-            self.state.strategy = output.strategy
-        
         return output
 
     def reflect_on_game(self, game_state: GameState, winner: str) -> str:
         """
         Ask the model to reflect on the game and update its memory file.
         """
-        system_prompt = f"""You are {self.state.name}, a player in a Mafia game.
-The game is over.
-Winner: {winner}
-Your Role: {self.state.role}
-Your Status: {'Alive' if self.state.is_alive else 'Dead'}
-
-GOAL:
-Analyze the game logs and your own performance. 
-Write a summary (MAX 200 WORDS) of what you learned, your strategy for next time, and key takeaways.
-This text will be SAVED to your memory file and provided to you in the next game.
-
-Output ONLY the memory text. Do not output JSON.
-"""
-
-        turn_prompt = "--- PUBLIC GAME LOG ---\n"
-        for log in game_state.public_logs:
-            if log.phase == "Reflection" and log.actor != "System":
-                continue
-            turn_prompt += f"[{log.phase}] {log.actor}: {log.content}\n"
+        parts = ["--- PUBLIC GAME LOG ---\n"]
+        parts.extend(
+            log.formatted
+            for log in game_state.public_logs
+            if not (log.phase == "Reflection" and log.actor != "System")
+        )
 
-        turn_prompt += "\n--- SECRET MAFIA LOG (Revealed) ---\n"
-        for log in game_state.mafia_logs:
-            turn_prompt += f"[{log.phase}] {log.actor}: {log.content}\n"
+        parts.append("\n--- SECRET MAFIA LOG (Revealed) ---\n")
+        parts.append(game_state.mafia_logs_text)
 
         if self.state.strategy:
-            turn_prompt += "\n--- YOUR FINAL STRATEGY (Context) ---\n"
-            turn_prompt += f"{self.state.strategy}\n"
+            parts.append("\n--- YOUR FINAL STRATEGY (Context) ---\n")
+            parts.append(f"{self.state.strategy}\n")
 
         if self.memory:
-            turn_prompt += f"\n--- YOUR OLD MEMORY ---\n{self.memory}\n"
+            parts.append(f"\n--- YOUR OLD MEMORY ---\n{self.memory}\n")
 
-        turn_prompt += "\n### INSTRUCTIONS ###\n"
-        turn_prompt += "Based on the above, write your NEW memory/strategy file (Max 200 words). This will REPLACE your old memory."
+        parts.append("\n### INSTRUCTIONS ###\n")
+        parts.append("Based on the above, write your NEW memory/strategy file (Max 200 words). This will REPLACE your old memory.")
+        turn_prompt = "".join(parts)
 
         # Use the existing client which enforces the TurnOutput schema (strategy, speech, vote).
         # We repurpose these fields for the reflection phase.
         
         log_name = f"{self.player_index}_{self.state.name}"
         try:
-            system_prompt = f"""You are {self.state.name}, a player in a Mafia game.
-The game is over.
-Winner: {winner}
-Your Role: {self.state.role}
-Your Status: {'Alive' if self.state.is_alive else 'Dead'}
-
-GOAL:
-Analyze the game logs and your own performance. 
-You must COMBINE your 'Old Memory' (if any) with the NEW lessons from this game.
-Write a single, updated summary (MAX 200 WORDS) that synthesizes your long-term strategy.
-This text will be SAVED to your memory file and provided to you in the next game.
-
-KEY INSTRUCTION:
-Focus on GENERIC RULES and HIGH-LEVEL STRATEGIES (e.g., "Always doubt the quiet ones," "Defend partners aggressively") rather than specific details from this game (e.g., "Don't trust Rick," "Vote for Qwen").
-We want actionable wisdom that applies to ANY game, not just a replay of this one.
-
-IMPORTANT:
-- Put your memory text in the 'strategy' field of the JSON output.
-- Set 'speech' to "MEMORY_FILE_UPDATE"
-- Set 'vote' to null
-- KEEP IT CONCISE. Absolute limit is 200 words. If you write more, it will be violently cut off.
+            system_prompt = _REFLECT_SYS_TMPL.format_map({
+                "name": self.state.name,
+                "winner": winner,
+                "role": self.state.role,
+                "status": "Alive" if self.state.is_alive else "Dead",
+            })
 
-OUTPUT: JSON only, no backticks.
-{"strategy": "YOUR_MEMORY_TEXT_HERE", "speech": "MEMORY_FILE_UPDATE", "vote": null}
-"""
-            
             output = self.client.generate_turn(
                 player_name=log_name,
                 provider=self.state.provider,
@@ -297,6 +342,7 @@ OUTPUT: JSON only, no backticks.
 
 class HumanPlayer(Player):
     """Human-controlled player - prompts for terminal input instead of LLM"""
+    __slots__ = ()
 
     def __init__(self, name: str, role: str, player_index: int):
         self.state = PlayerState(
@@ -304,13 +350,16 @@ class HumanPlayer(Player):
             role=role,
             provider="human",
             model_name="human",
-            use_cli=False
+            use_cli=False,
+            is_human=True
         )
         self.player_index = player_index
         self.partner_name: Optional[str] = None
         self.memory: str = ""
         self.memory_enabled = False
         self.client = None
+        self._system_prefix: Optional[str] = None
+        self._sys_prompt_cache: Dict[tuple, str] = {}
 
     def _multiline_input(self, prompt_text: str) -> Optional[str]:
         """Read multiline input with prompt_toolkit - double Enter to submit"""
@@ -1,36 +1,123 @@
+from dataclasses import dataclass, field, replace
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
 from uuid import uuid4
 
+# TurnOutput is parsed from untrusted LLM JSON, so it stays a validated pydantic model.
+# Game-loop state below is only built by the engine and mutated constantly - plain slotted dataclasses.
+
 class TurnOutput(BaseModel):
     strategy: Optional[str] = Field("", description="Your strategic plan (max 100 words) - overwrites previous")
     speech: Optional[str] = Field("", description="Public statement to the town (max 75 words)")
     vote: Optional[str] = Field(None, description="Name of player to vote for (or None if not voting phase)")
 
-class LogEntry(BaseModel):
+@dataclass(slots=True)
+class LogEntry:
     turn: int
     phase: str
     actor: str
     action: str  # speak, vote, kill, die, system
     content: str
+    t_rel: Optional[float] = None  # Seconds since the current phase started
+    # Prompt line for this entry; entries are never mutated once logged
+    formatted: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.formatted = f"[{self.phase}] {self.actor}: {self.content}\n"
 
-class PlayerState(BaseModel):
+@dataclass(slots=True)
+class PlayerState:
     name: str # Version + Model Name
     role: Literal["Mafia", "Villager", "Cop"]
-    is_alive: bool = True
     provider: str
     model_name: str # Technical API model name
+    is_alive: bool = True
     use_cli: bool = True  # True = CLI tool, False = API
     strategy: str = ""  # Living strategic plan, overwritten each turn
+    is_human: bool = False  # Set by HumanPlayer; cheaper than isinstance checks in the engine
 
-class GameState(BaseModel):
-    game_id: str = Field(default_factory=lambda: str(uuid4()))
+@dataclass(slots=True)
+class GameState:
+    game_id: str = field(default_factory=lambda: str(uuid4()))
     turn: int = 1
     phase: str = "Setup"
-    players: List[PlayerState] = []
-    nominees: List[str] = []  # List of player names nominated for elimination
+    players: List[PlayerState] = field(default_factory=list)
+    nominees: List[str] = field(default_factory=list)  # List of player names nominated for elimination
     on_trial: Optional[str] = None  # Name of player currently on trial
     reveal_role_on_death: bool = True  # Whether to reveal role when player dies
-    public_logs: List[LogEntry] = []
-    mafia_logs: List[LogEntry] = [] # Secret logs for Mafia eyes only
-    cop_logs: List[LogEntry] = [] # Secret logs for Cop eyes only
+    public_logs: List[LogEntry] = field(default_factory=list)
+    mafia_logs: List[LogEntry] = field(default_factory=list) # Secret logs for Mafia eyes only
+    cop_logs: List[LogEntry] = field(default_factory=list) # Secret logs for Cop eyes only
+    # Roster views maintained by the engine (set_roster/mark_dead) so prompts don't rescan players
+    players_by_name: Dict[str, PlayerState] = field(default_factory=dict)  # Same objects as players, so liveness stays current
+    living_names: List[str] = field(default_factory=list)
+    dead_names: List[str] = field(default_factory=list)
+    living_str: str = ""
+    dead_str: str = "None"
+    living_mafia: int = 0
+
+    # Prompt text of each log, extended on append so prompts don't re-format history
+    public_logs_text: str = ""
+    mafia_logs_text: str = ""
+    cop_logs_text: str = ""
+    # Summary of the oldest public log entries: (digest, entries folded, chars of public_logs_text folded).
+    # Swapped in as one tuple so prompt builders on other threads never see a half-updated digest.
+    public_log_digest: Optional[Tuple[str, int, int]] = None
+    # (key, text) of the last rendered public log section - see public_log_section()
+    _public_section: Optional[Tuple[tuple, str]] = field(default=None, init=False, repr=False)
+
+    def snapshot(self, **changes) -> "GameState":
+        """Shallow copy for prompting from a fixed point in the game (lists are shared, text fields are not)"""
+        return replace(self, **changes)
+
+    def public_log_section(self) -> str:
+        """The public LOG section every turn prompt shares; rebuilt only when the log or digest changes"""
+        key = (len(self.public_logs_text), self.public_log_digest)
+        cached = self._public_section
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        digest = self.public_log_digest
+        if digest:
+            text = f"--- EARLIER (summary) ---\n{digest[0]}\n\n--- RECENT LOG ---\n{self.public_logs_text[digest[2]:]}"
+        else:
+            text = "--- LOG ---\n" + self.public_logs_text
+        self._public_section = (key, text)
+        return text
+
+    def add_public_log(self, entry: LogEntry):
+        self.public_logs.append(entry)
+        self.public_logs_text += entry.formatted
+
+    def add_mafia_log(self, entry: LogEntry):
+        self.mafia_logs.append(entry)
+        self.mafia_logs_text += entry.formatted
+
+    def add_cop_log(self, entry: LogEntry):
+        self.cop_logs.append(entry)
+        self.cop_logs_text += entry.formatted
+
+    def set_roster(self):
+        by_name, living, dead, mafia = {}, [], [], 0
+        for p in self.players:  # One pass for every view
+            by_name[p.name] = p
+            if p.is_alive:
+                living.append(p.name)
+                if p.role == "Mafia":
+                    mafia += 1
+            else:
+                dead.append(p.name)
+        self.players_by_name = by_name
+        self.living_names = living
+        self.dead_names = dead
+        self.living_mafia = mafia
+        self.living_str = ", ".join(self.living_names)
+        self.dead_str = ", ".join(self.dead_names) if self.dead_names else "None"
+
+    def mark_dead(self, name: str, role: str):
+        # Rebind rather than mutate: snapshots share these lists
+        self.living_names = [n for n in self.living_names if n != name]
+        self.dead_names = self.dead_names + [name]
+        if role == "Mafia":
+            self.living_mafia -= 1
+        self.living_str = ", ".join(self.living_names)
+        self.dead_str = ", ".join(self.dead_names)
@@ -1,6 +1,7 @@
 # tts_engine.py - Text-to-Speech engine using Edge TTS
 
 import os
+import queue
 import asyncio
 import tempfile
 import subprocess
@@ -16,24 +17,44 @@ except ImportError:
 
 
 class TTSEngine:
-    """Edge TTS wrapper with background playback support"""
+    """Edge TTS wrapper with queued background playback.
+
+    Audio files are queued and played in order by a single playback thread,
+    so callers only block where they actually need audio to have finished."""
 
     def __init__(self, enabled: bool = True, rate: str = TTS_RATE):
         self.enabled = enabled and EDGE_TTS_AVAILABLE
         self.rate = rate
         self._voice_map = {}  # player_name -> voice_id
         self._name_cache = {}  # player_name -> cached audio path
-        self._current_thread = None  # Track current TTS thread
+        self._queue = queue.Queue()  # audio paths waiting for playback
+        self._pending = 0  # queued + currently playing
+        self._idle = threading.Condition()
+        self._player_thread = None  # Started on first playback
         if enabled and not EDGE_TTS_AVAILABLE:
             print("[TTS] edge-tts not installed. Run: pip install edge-tts")
 
     def register_player(self, name: str, voice: str):
         self._voice_map[name] = voice
 
-    def wait_for_speech(self):
-        """Wait for current speech to finish"""
-        if self._current_thread and self._current_thread.is_alive():
-            self._current_thread.join()
+    def is_speaking(self) -> bool:
+        """True while any queued audio has not finished playing"""
+        return self._pending > 0
+
+    def wait_for_speech(self, timeout: float = None) -> bool:
+        """Wait for all queued speech to finish. Returns False if timeout expired first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _playback_loop(self):
+        """Consumer thread: play queued files one after another"""
+        while True:
+            path = self._queue.get()
+            self._play_file_sync(path)
+            with self._idle:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
 
     def _get_cached_name(self, player_name: str) -> str:
         """Get or create cached audio file for player name announcement."""
@@ -111,16 +132,15 @@ class TTSEngine:
             return None
 
     def play_file(self, path: str, background: bool = False):
-        """Play an existing audio file"""
-        if background:
-            self.wait_for_speech()
-            self._current_thread = threading.Thread(
-                target=self._play_file_sync, args=(path,), daemon=True
-            )
-            self._current_thread.start()
-        else:
+        """Queue an existing audio file. Plays after earlier audio; blocks until done unless background=True."""
+        if self._player_thread is None:
+            self._player_thread = threading.Thread(target=self._playback_loop, daemon=True)
+            self._player_thread.start()
+        with self._idle:
+            self._pending += 1
+        self._queue.put(path)
+        if not background:
             self.wait_for_speech()
-            self._play_file_sync(path)
 
     def _play_file_sync(self, path: str):
         try: